@@ -14,12 +14,17 @@ them from public data, so we fit them to match published range-payload
 performance. This means the model absorbs compressibility effects, trim drag,
 and other contributions into the effective CD0 and e values at cruise.
 
+The drag-polar functions used inside the mission integrators are compiled
+with numba when it is available (see src/utils.py).
+
 See ASSUMPTIONS_LOG.md entries B1, B2, B3.
 """
 
 import math
+from src.utils import njit
 
 
+@njit(cache=True)
 def lift_coefficient(weight_lb, dynamic_pressure_psf, wing_area_ft2):
     """Compute lift coefficient in steady level flight (L = W).
 
@@ -36,6 +41,7 @@ def lift_coefficient(weight_lb, dynamic_pressure_psf, wing_area_ft2):
     return weight_lb / (dynamic_pressure_psf * wing_area_ft2)
 
 
+@njit(cache=True)
 def drag_coefficient(CL, CD0, AR, e):
     """Compute drag coefficient using parabolic drag polar.
 
@@ -54,6 +60,7 @@ def drag_coefficient(CL, CD0, AR, e):
     return CD0 + K * CL ** 2
 
 
+@njit(cache=True)
 def induced_drag_factor(AR, e):
     """Compute the induced drag factor K = 1 / (π · AR · e).
 
@@ -7,10 +7,14 @@ Layers modeled:
   - Troposphere: 0 to 36,089 ft (0 to 11,000 m) — linear temperature lapse
   - Lower stratosphere: 36,089 to 65,617 ft (11,000 to 20,000 m) — isothermal
 
+All functions are scalar and compiled with numba when it is available, so
+they can be called from other compiled kernels as well as from Python.
+
 See ASSUMPTIONS_LOG.md entry A1.
 """
 
 import math
+from src.utils import njit
 
 
 # --- ISA Sea Level Constants ---
@@ -32,6 +36,7 @@ R = 1716.49  # ft·lbf/(slug·°R), specific gas constant for dry air
 G = 32.174   # ft/s², standard gravitational acceleration
 
 
+@njit(cache=True)
 def temperature(h_ft):
     """ISA temperature at geometric altitude.
 
@@ -51,6 +56,7 @@ def temperature(h_ft):
         return T0 + LAPSE_RATE * H_TROPOPAUSE
 
 
+@njit(cache=True)
 def pressure(h_ft):
     """ISA pressure at geometric altitude.
 
@@ -60,18 +66,21 @@ def pressure(h_ft):
     Returns:
         Pressure in lbf/ft²
     """
+    exponent = -G / (LAPSE_RATE * R)
     if h_ft <= H_TROPOPAUSE:
         # Troposphere: P = P0 * (T/T0)^(g/(L*R))
         T = temperature(h_ft)
-        exponent = -G / (LAPSE_RATE * R)
         return P0 * (T / T0) ** exponent
     else:
         # Stratosphere (isothermal): P = P_trop * exp(-g*(h-h_trop)/(R*T_trop))
-        P_trop = pressure(H_TROPOPAUSE)
+        # P_trop uses the troposphere relation directly rather than recursing,
+        # which numba's on-disk cache cannot reload safely.
         T_trop = temperature(H_TROPOPAUSE)
+        P_trop = P0 * (T_trop / T0) ** exponent
         return P_trop * math.exp(-G * (h_ft - H_TROPOPAUSE) / (R * T_trop))
 
 
+@njit(cache=True)
 def density(h_ft):
     """ISA air density at geometric altitude.
 
@@ -86,6 +95,7 @@ def density(h_ft):
     return pressure(h_ft) / (R * temperature(h_ft))
 
 
+@njit(cache=True)
 def speed_of_sound(h_ft):
     """Speed of sound at altitude.
 
@@ -100,21 +110,25 @@ def speed_of_sound(h_ft):
     return math.sqrt(GAMMA * R * temperature(h_ft))
 
 
+@njit(cache=True)
 def density_ratio(h_ft):
     """Ratio of density at altitude to sea level density (sigma)."""
     return density(h_ft) / RHO0
 
 
+@njit(cache=True)
 def pressure_ratio(h_ft):
     """Ratio of pressure at altitude to sea level pressure (delta)."""
     return pressure(h_ft) / P0
 
 
+@njit(cache=True)
 def temperature_ratio(h_ft):
     """Ratio of temperature at altitude to sea level temperature (theta)."""
     return temperature(h_ft) / T0
 
 
+@njit(cache=True)
 def dynamic_pressure(h_ft, velocity_fps):
     """Dynamic pressure q = 0.5 * rho * V^2.
 
@@ -95,6 +95,53 @@ def compute_calibration_range(aircraft_data, payload_lb, fuel_lb,
     return total_range
 
 
+def compute_calibration_range_batch(aircraft_data, payload_lb, fuel_lb,
+                                    CD0, e, k_adj, f_oh, n_steps=30):
+    """Compute calibration ranges for many loadings or parameter sets.
+
+    Takes the same arguments as compute_calibration_range(), but payload,
+    fuel, and the calibration parameters may be arrays; they are broadcast
+    against each other and all feasible cases run in a single
+    performance.step_cruise_range_batch() call.
+
+    Returns:
+        Array of predicted mission ranges in nautical miles, 0 where the
+        overhead leaves no cruise fuel
+    """
+    ac = aircraft_data
+    payload_lb, fuel_lb, CD0, e, k_adj, f_oh = (
+        np.asarray(a, dtype=np.float64)
+        for a in np.broadcast_arrays(payload_lb, fuel_lb, CD0, e, k_adj, f_oh)
+    )
+    W_tow = ac["OEW"] + payload_lb + fuel_lb
+
+    # Non-cruise fuel overhead
+    overhead = f_oh * W_tow
+    cruise_fuel = fuel_lb - overhead
+    feasible = cruise_fuel > 0
+
+    total_range = np.zeros(W_tow.shape)
+    if feasible.any():
+        result = performance.step_cruise_range_batch(
+            W_initial_lb=W_tow[feasible],
+            fuel_available_lb=cruise_fuel[feasible],
+            mach=ac["cruise_mach"],
+            wing_area_ft2=ac["wing_area_ft2"],
+            CD0=CD0[feasible],
+            AR=ac["aspect_ratio"],
+            e=e[feasible],
+            tsfc_ref=ac["tsfc_cruise_ref"],
+            k_adj=k_adj[feasible],
+            ceiling_ft=ac.get("service_ceiling_ft", 43_000),
+            thrust_slst_lbf=ac["thrust_per_engine_slst_lbf"],
+            n_engines=ac["n_engines"],
+            n_steps=n_steps,
+        )
+        total_range[feasible] = (result["range_nm"] + CLIMB_DISTANCE_NM
+                                 + DESCENT_DISTANCE_NM)
+    return total_range
+
+
 def calibration_error(params, aircraft_data, calibration_points, n_steps=30):
     """Compute RMS relative range error for given parameters.
 
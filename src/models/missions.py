@@ -15,16 +15,350 @@ Fuel budget approach (from PHASE2_STEP1_RECONCILIATION.md):
   Mission 3: Explicit reserves only (no f_oh)
 """
 
+import functools
 import math
+import numpy as np
 from src.models import atmosphere, performance, aerodynamics, propulsion
 from src.models.calibration import CLIMB_DISTANCE_NM, DESCENT_DISTANCE_NM
-from src.utils import fuel_cost, NM_TO_FT, FT_TO_NM
+from src.utils import fuel_cost, njit, prange, NM_TO_FT, FT_TO_NM
+
+
+# Column layout of the per-step array filled by _climb_driver()
+_CLIMB_COLUMNS = (
+    "h_start_ft", "h_end_ft", "h_mid_ft", "W_start_lb", "fuel_lb",
+    "distance_nm", "time_hr", "roc_fpm", "thrust_avail_lbf", "drag_lbf",
+    "excess_thrust_lbf", "CL", "mach",
+)
+
+# Record type of climb_segment()["steps"]; one float64 field per column, so
+# the driver's row-major step buffer can be viewed as records without a copy
+CLIMB_STEP_DTYPE = np.dtype([(name, np.float64) for name in _CLIMB_COLUMNS])
+
+# Step record types by climb_segment(precision=...)
+_CLIMB_STEP_DTYPES = {
+    "f8": CLIMB_STEP_DTYPE,
+    "f4": np.dtype([(name, np.float32) for name in _CLIMB_COLUMNS]),
+}
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _level_flight_drag(W_lb, h_ft, mach, wing_area_ft2, CD0, AR, e):
+    """Drag, true airspeed, and CL at a given weight, altitude, and Mach.
+
+    Returns:
+        Tuple of (drag_lbf, V_fps, CL)
+    """
+    V_fps = mach * atmosphere.speed_of_sound(h_ft)
+    q = 0.5 * atmosphere.density(h_ft) * V_fps ** 2
+    CL = aerodynamics.lift_coefficient(W_lb, q, wing_area_ft2)
+    CD = aerodynamics.drag_coefficient(CL, CD0, AR, e)
+    return CD * q * wing_area_ft2, V_fps, CL
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _climb_altitude_grid(h_start_ft, h_target_ft, h_step_ft, mach,
+                         tsfc_ref, k_adj, thrust_slst_lbf, n_engines):
+    """Evaluate the weight-independent climb quantities on the altitude grid.
+
+    Speed, dynamic pressure, thrust available, and TSFC at each step
+    midpoint depend only on altitude, so they are computed for the whole
+    grid up front; only the weight update is left to the sequential pass.
+
+    Returns:
+        Tuple of arrays (h_lo_ft, dh_ft, h_mid_ft, V_fps, q_psf,
+        thrust_avail_lbf, tsfc), one entry per altitude step.
+    """
+    n = int(math.ceil((h_target_ft - h_start_ft) / h_step_ft))
+    h_lo = h_start_ft + h_step_ft * np.arange(n)
+    dh = np.minimum(h_step_ft, h_target_ft - h_lo)
+    h_mid = h_lo + dh / 2.0
+
+    a_mid = np.empty(n)
+    rho_mid = np.empty(n)
+    thrust_avail = np.empty(n)
+    tsfc_val = np.empty(n)
+    for i in range(n):
+        a_mid[i] = atmosphere.speed_of_sound(h_mid[i])
+        rho_mid[i] = atmosphere.density(h_mid[i])
+        thrust_avail[i] = propulsion.thrust_available_cruise(
+            thrust_slst_lbf, h_mid[i], n_engines
+        )
+        tsfc_val[i] = propulsion.tsfc(h_mid[i], mach, tsfc_ref, k_adj)
+
+    V_fps = mach * a_mid
+    q = 0.5 * rho_mid * V_fps ** 2
+    return h_lo, dh, h_mid, V_fps, q, thrust_avail, tsfc_val
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _climb_step_kernel(W_lb, dh_ft, V_fps, qS_lbf, inv_qS, thrust_avail,
+                       tsfc_val, CD0, K):
+    """Integrate one altitude step of a constant-Mach climb.
+
+    ROC = V * (T_avail - D) / W; fuel = (D + W * sin(gamma)) * TSFC * dt.
+    When there is no excess thrust, only roc_fpm, drag, excess, and CL
+    are meaningful (the caller stops the climb).
+
+    q*S, its reciprocal, and the induced drag factor K are passed in
+    precomputed, leaving sin(gamma) and dt as the only divisions per step.
+
+    Returns:
+        Tuple of (roc_fpm, fuel_lb, distance_nm, time_hr,
+                  drag_lbf, excess_thrust_lbf, CL)
+    """
+    CL = W_lb * inv_qS
+    drag_lbf = (CD0 + K * CL * CL) * qS_lbf
+
+    excess_thrust = thrust_avail - drag_lbf
+    if excess_thrust <= 0:
+        return -1.0, 0.0, 0.0, 0.0, drag_lbf, excess_thrust, CL
+
+    # Rate of climb: ROC = V * sin(gamma), sin(gamma) = T_excess / W
+    sin_gamma = excess_thrust / W_lb
+    roc_fps = V_fps * sin_gamma
+
+    # Time for this altitude step
+    dt_sec = dh_ft / roc_fps
+    dt_hr = dt_sec * (1.0 / 3600.0)
+
+    # Engine thrust = drag + climb component
+    thrust_required = drag_lbf + W_lb * sin_gamma
+    fuel_lb = thrust_required * tsfc_val * dt_hr
+
+    # Horizontal distance
+    cos_gamma = math.sqrt(1.0 - sin_gamma * sin_gamma)
+    dist_nm = V_fps * cos_gamma * dt_sec * FT_TO_NM
+
+    return roc_fps * 60.0, fuel_lb, dist_nm, dt_hr, drag_lbf, excess_thrust, CL
+
+
+@functools.lru_cache(maxsize=128)
+def _climb_grid(h_start_ft, h_target_ft, h_step_ft, mach,
+                tsfc_ref, k_adj, thrust_slst_lbf, n_engines):
+    """Memoized _climb_altitude_grid().
+
+    Mission 2 climbs from the same h_low on the same grid every cycle,
+    so the grid is computed once per aircraft and climb configuration.
+    The arrays are shared between callers and are marked read-only.
+    """
+    grid = _climb_altitude_grid(h_start_ft, h_target_ft, h_step_ft, mach,
+                                tsfc_ref, k_adj, thrust_slst_lbf, n_engines)
+    for arr in grid:
+        arr.flags.writeable = False
+    return grid
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _climb_driver(steps, W_start_lb, h_target_ft, mach_climb, h_lo, dh,
+                  h_mid, V_fps, q, thrust_avail, tsfc_val, wing_area_ft2,
+                  CD0, AR, e, roc_min_fpm):
+    """Run the altitude-stepping climb loop for climb_segment().
+
+    The altitude-only quantities come from _climb_grid(); only the weight
+    update is carried through the loop. Per-step values are written into
+    steps, a row-major buffer with one row per grid step and one column
+    per _CLIMB_COLUMNS entry, in whatever float dtype the caller chose.
+
+    Returns:
+        Tuple of (n_steps, ceiling_ft, ceiling_limited, fuel_lb,
+        distance_nm, time_hr); the first n_steps rows of steps are filled.
+    """
+    n_max = h_lo.shape[0]
+
+    # Weight-independent aero terms, hoisted out of the stepping loop
+    qS = q * wing_area_ft2
+    inv_qS = 1.0 / qS
+    K = aerodynamics.induced_drag_factor(AR, e)
+
+    total_fuel = 0.0
+    total_distance_nm = 0.0
+    total_time_hr = 0.0
+    W_current = W_start_lb
+    ceiling_ft = h_target_ft
+    ceiling_limited = False
+    n = 0
+
+    for i in range(n_max):
+        (roc_fpm, fuel_step, dist_nm, dt_hr,
+         drag_lbf, excess_thrust, CL) = _climb_step_kernel(
+            W_current, dh[i], V_fps[i], qS[i], inv_qS[i], thrust_avail[i],
+            tsfc_val[i], CD0, K,
+        )
+
+        # Service ceiling: no excess thrust, or ROC below the minimum
+        if excess_thrust <= 0 or roc_fpm < roc_min_fpm:
+            ceiling_ft = h_lo[i]
+            ceiling_limited = True
+            break
+
+        steps[n, 0] = h_lo[i]
+        steps[n, 1] = h_lo[i] + dh[i]
+        steps[n, 2] = h_mid[i]
+        steps[n, 3] = W_current
+        steps[n, 4] = fuel_step
+        steps[n, 5] = dist_nm
+        steps[n, 6] = dt_hr
+        steps[n, 7] = roc_fpm
+        steps[n, 8] = thrust_avail[i]
+        steps[n, 9] = drag_lbf
+        steps[n, 10] = excess_thrust
+        steps[n, 11] = CL
+        steps[n, 12] = mach_climb
+        n += 1
+
+        # Update state
+        total_fuel += fuel_step
+        total_distance_nm += dist_nm
+        total_time_hr += dt_hr
+        W_current -= fuel_step
+
+    return (n, ceiling_ft, ceiling_limited,
+            total_fuel, total_distance_nm, total_time_hr)
+
+
+# Altitude step bounds for the adaptive climb (h_step_ft=None), ft
+_ADAPTIVE_DH_INIT_FT = 1000.0
+_ADAPTIVE_DH_MIN_FT = 100.0
+_ADAPTIVE_DH_MAX_FT = 5000.0
+# Climb left below this is treated as done, so a rounding residue of the
+# accumulated altitude never becomes an extra step, ft
+_ADAPTIVE_H_TOL_FT = 1e-6
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _climb_conditions(h_ft, mach, wing_area_ft2, tsfc_ref, k_adj,
+                      thrust_slst_lbf, n_engines):
+    """Weight-independent climb quantities at a single altitude.
+
+    Scalar counterpart of _climb_altitude_grid() for the adaptive climb,
+    whose step altitudes are not known in advance.
+
+    Returns:
+        Tuple of (V_fps, qS_lbf, inv_qS, thrust_avail_lbf, tsfc)
+    """
+    V_fps = mach * atmosphere.speed_of_sound(h_ft)
+    qS = 0.5 * atmosphere.density(h_ft) * V_fps ** 2 * wing_area_ft2
+    thrust_avail = propulsion.thrust_available_cruise(
+        thrust_slst_lbf, h_ft, n_engines
+    )
+    return (V_fps, qS, 1.0 / qS, thrust_avail,
+            propulsion.tsfc(h_ft, mach, tsfc_ref, k_adj))
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _climb_driver_adaptive(steps, W_start_lb, h_start_ft, h_target_ft,
+                           mach_climb, wing_area_ft2, CD0, AR, e, tsfc_ref,
+                           k_adj, thrust_slst_lbf, n_engines, tol_fuel_lb,
+                           roc_min_fpm):
+    """Adaptive-step climb loop for climb_segment(h_step_ft=None).
+
+    Each step is a midpoint (RK2) step: an Euler estimate from the step
+    start gives the weight at the midpoint, where the step is evaluated.
+    The difference between the two fuel estimates bounds the local error;
+    steps whose error exceeds tol_fuel_lb are halved, and the next step
+    grows or shrinks with sqrt(tol_fuel_lb / error) within
+    [_ADAPTIVE_DH_MIN_FT, _ADAPTIVE_DH_MAX_FT].
+
+    The service ceiling is the altitude at which ROC at the step start (or,
+    at the minimum step, at the midpoint) falls below roc_min_fpm.
+
+    The loop also stops when steps is full, so it never writes past the
+    buffer; climb_segment() sizes it one row above the step count at the
+    minimum step.
+
+    Returns:
+        Same tuple as _climb_driver(); steps should have at least
+        ceil((h_target_ft - h_start_ft) / _ADAPTIVE_DH_MIN_FT) + 1 rows.
+    """
+    K = aerodynamics.induced_drag_factor(AR, e)
+
+    total_fuel = 0.0
+    total_distance_nm = 0.0
+    total_time_hr = 0.0
+    W_current = W_start_lb
+    h_current = h_start_ft
+    ceiling_ft = h_target_ft
+    ceiling_limited = False
+    dh = _ADAPTIVE_DH_INIT_FT
+    n = 0
+
+    n_max = steps.shape[0]
+
+    while h_target_ft - h_current > _ADAPTIVE_H_TOL_FT and n < n_max:
+        dh = min(dh, h_target_ft - h_current)
+
+        # Euler estimate from the step start; also the ceiling check
+        V0, qS0, inv_qS0, T0, tsfc0 = _climb_conditions(
+            h_current, mach_climb, wing_area_ft2, tsfc_ref, k_adj,
+            thrust_slst_lbf, n_engines,
+        )
+        roc0, fuel_euler, _, _, _, excess0, _ = _climb_step_kernel(
+            W_current, dh, V0, qS0, inv_qS0, T0, tsfc0, CD0, K,
+        )
+        if excess0 <= 0 or roc0 < roc_min_fpm:
+            ceiling_ft = h_current
+            ceiling_limited = True
+            break
+
+        # Midpoint step at the Euler-predicted midpoint weight
+        h_mid = h_current + 0.5 * dh
+        Vm, qSm, inv_qSm, Tm, tsfcm = _climb_conditions(
+            h_mid, mach_climb, wing_area_ft2, tsfc_ref, k_adj,
+            thrust_slst_lbf, n_engines,
+        )
+        (roc_fpm, fuel_step, dist_nm, dt_hr,
+         drag_lbf, excess_thrust, CL) = _climb_step_kernel(
+            W_current - 0.5 * fuel_euler, dh, Vm, qSm, inv_qSm, Tm, tsfcm,
+            CD0, K,
+        )
+        midpoint_fails = excess_thrust <= 0 or roc_fpm < roc_min_fpm
+        err = abs(fuel_step - fuel_euler)
+        if midpoint_fails or err > tol_fuel_lb:
+            if dh > _ADAPTIVE_DH_MIN_FT:
+                dh = max(0.5 * dh, _ADAPTIVE_DH_MIN_FT)
+                continue
+            if midpoint_fails:
+                ceiling_ft = h_current
+                ceiling_limited = True
+                break
+
+        steps[n, 0] = h_current
+        steps[n, 1] = h_current + dh
+        steps[n, 2] = h_mid
+        steps[n, 3] = W_current
+        steps[n, 4] = fuel_step
+        steps[n, 5] = dist_nm
+        steps[n, 6] = dt_hr
+        steps[n, 7] = roc_fpm
+        steps[n, 8] = Tm
+        steps[n, 9] = drag_lbf
+        steps[n, 10] = excess_thrust
+        steps[n, 11] = CL
+        steps[n, 12] = mach_climb
+        n += 1
+
+        # Update state
+        total_fuel += fuel_step
+        total_distance_nm += dist_nm
+        total_time_hr += dt_hr
+        W_current -= fuel_step
+        h_current += dh
+
+        # Next step size from the local error estimate
+        if err > 0:
+            dh *= min(2.0, max(0.5, 0.9 * math.sqrt(tol_fuel_lb / err)))
+        else:
+            dh *= 2.0
+        dh = min(max(dh, _ADAPTIVE_DH_MIN_FT), _ADAPTIVE_DH_MAX_FT)
+
+    return (n, ceiling_ft, ceiling_limited,
+            total_fuel, total_distance_nm, total_time_hr)
 
 
 def climb_segment(W_start_lb, h_start_ft, h_target_ft, mach_climb,
                    wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
                    thrust_slst_lbf, n_engines, h_step_ft=1000,
-                   roc_min_fpm=100.0):
+                   roc_min_fpm=100.0, precision="f8", tol_fuel_lb=5.0):
     """Compute fuel, distance, and time for a climb between two altitudes.
 
     Uses altitude-stepping integration. At each step:
@@ -35,6 +369,11 @@ def climb_segment(W_start_lb, h_start_ft, h_target_ft, mach_climb,
     - Compute fuel flow, time for step, distance covered
     - Update weight
 
+    The stepping loop runs in the compiled _climb_driver() kernel; this
+    wrapper only packages its output. With h_step_ft=None the climb uses
+    adaptive midpoint (RK2) steps instead (_climb_driver_adaptive()),
+    sized so each step's fuel error estimate stays within tol_fuel_lb.
+
     Args:
         W_start_lb: Aircraft weight at start of climb (lbf)
         h_start_ft: Starting altitude (ft)
@@ -48,8 +387,14 @@ def climb_segment(W_start_lb, h_start_ft, h_target_ft, mach_climb,
         k_adj: TSFC calibration adjustment factor
         thrust_slst_lbf: Sea-level static thrust per engine (lbf)
         n_engines: Number of operating engines
-        h_step_ft: Altitude integration step size (ft, default 1000)
+        h_step_ft: Altitude integration step size (ft, default 1000), or
+            None for adaptive steps of 100-5,000 ft
         roc_min_fpm: Minimum ROC for service ceiling definition (ft/min, default 100)
+        precision: Float type of the per-step records, "f8" (default) or
+            "f4" to halve their memory. The integration and the returned
+            totals are always float64.
+        tol_fuel_lb: Per-step fuel error tolerance for adaptive steps (lb,
+            default 5); ignored when h_step_ft is given
 
     Returns:
         dict with:
@@ -57,117 +402,178 @@ def climb_segment(W_start_lb, h_start_ft, h_target_ft, mach_climb,
             distance_nm: Horizontal distance covered during climb
             time_hr: Total climb time in hours
             ceiling_ft: Actual ceiling achieved (may be < h_target_ft)
-            steps: List of per-step dicts for plotting/analysis
+            steps: Structured array of per-step records (CLIMB_STEP_DTYPE,
+                or its float32 counterpart) for plotting/analysis
             ceiling_limited: True if climb stopped before h_target_ft
     """
+    if precision not in _CLIMB_STEP_DTYPES:
+        raise ValueError(
+            f"precision must be 'f8' or 'f4', got {precision!r}"
+        )
+    step_dtype = _CLIMB_STEP_DTYPES[precision]
+
     if h_start_ft >= h_target_ft:
         return {
             "fuel_burned_lb": 0.0,
             "distance_nm": 0.0,
             "time_hr": 0.0,
             "ceiling_ft": h_start_ft,
-            "steps": [],
+            "steps": np.empty(0, dtype=step_dtype),
             "ceiling_limited": False,
         }
 
-    total_fuel = 0.0
-    total_distance_nm = 0.0
-    total_time_hr = 0.0
-    W_current = W_start_lb
-    h_current = h_start_ft
-    steps = []
-    ceiling_limited = False
-
-    while h_current < h_target_ft:
-        # Altitude step (may be partial at the top)
-        dh = min(h_step_ft, h_target_ft - h_current)
-        h_mid = h_current + dh / 2.0
-
-        # Atmospheric conditions at midpoint
-        a_mid = atmosphere.speed_of_sound(h_mid)
-        V_fps = mach_climb * a_mid
-        rho_mid = atmosphere.density(h_mid)
-        q_mid = 0.5 * rho_mid * V_fps ** 2
-
-        # Aerodynamics at current weight and midpoint altitude
-        CL = aerodynamics.lift_coefficient(W_current, q_mid, wing_area_ft2)
-        CD = aerodynamics.drag_coefficient(CL, CD0, AR, e)
-        drag_lbf = CD * q_mid * wing_area_ft2
-
-        # Thrust available at midpoint altitude
-        thrust_avail = propulsion.thrust_available_cruise(
-            thrust_slst_lbf, h_mid, n_engines
+    if h_step_ft is None:
+        n_max = math.ceil((h_target_ft - h_start_ft) / _ADAPTIVE_DH_MIN_FT) + 1
+        step_data = np.empty((n_max, len(_CLIMB_COLUMNS)), dtype=precision)
+        (n_steps, ceiling_ft, ceiling_limited,
+         total_fuel, total_distance_nm, total_time_hr) = _climb_driver_adaptive(
+            step_data, float(W_start_lb), float(h_start_ft),
+            float(h_target_ft), float(mach_climb), float(wing_area_ft2),
+            float(CD0), float(AR), float(e), float(tsfc_ref), float(k_adj),
+            float(thrust_slst_lbf), int(n_engines), float(tol_fuel_lb),
+            float(roc_min_fpm),
+        )
+    else:
+        grid = _climb_grid(float(h_start_ft), float(h_target_ft),
+                           float(h_step_ft), float(mach_climb),
+                           float(tsfc_ref), float(k_adj),
+                           float(thrust_slst_lbf), int(n_engines))
+        step_data = np.empty((len(grid[0]), len(_CLIMB_COLUMNS)),
+                             dtype=precision)
+        (n_steps, ceiling_ft, ceiling_limited,
+         total_fuel, total_distance_nm, total_time_hr) = _climb_driver(
+            step_data, float(W_start_lb), float(h_target_ft),
+            float(mach_climb), *grid,
+            float(wing_area_ft2), float(CD0), float(AR), float(e),
+            float(roc_min_fpm),
         )
 
-        # Excess thrust -> climb capability
-        excess_thrust = thrust_avail - drag_lbf
-        if excess_thrust <= 0:
-            ceiling_limited = True
-            break
+    steps = step_data[:n_steps].view(step_dtype).reshape(n_steps)
 
-        # Rate of climb: ROC = V * (T_excess / W)
-        # sin(gamma) = T_excess / W, ROC = V * sin(gamma)
-        sin_gamma = excess_thrust / W_current
-        roc_fps = V_fps * sin_gamma
-        roc_fpm = roc_fps * 60.0
+    return {
+        "fuel_burned_lb": float(total_fuel),
+        "distance_nm": float(total_distance_nm),
+        "time_hr": float(total_time_hr),
+        "ceiling_ft": float(ceiling_ft),
+        "steps": steps,
+        "ceiling_limited": bool(ceiling_limited),
+    }
 
-        if roc_fpm < roc_min_fpm:
-            ceiling_limited = True
-            break
 
-        # Time for this altitude step
-        dt_sec = dh / roc_fps
-        dt_hr = dt_sec / 3600.0
-
-        # Fuel burn: thrust_required * TSFC * time
-        # During climb, thrust ~ drag + W * sin(gamma) = thrust_avail
-        # But we use a more accurate formulation: the engine produces
-        # thrust equal to drag + climb component
-        thrust_required = drag_lbf + W_current * sin_gamma
-        tsfc_val = propulsion.tsfc(h_mid, mach_climb, tsfc_ref, k_adj)
-        fuel_flow_lbhr = thrust_required * tsfc_val
-        fuel_this_step = fuel_flow_lbhr * dt_hr
+@njit(cache=True, fastmath=True, error_model='numpy', parallel=True)
+def _climb_batch_kernel(W_start_lb, h_start_ft, h_target_ft, mach_climb,
+                        wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
+                        thrust_slst_lbf, n_engines, h_step_ft, roc_min_fpm,
+                        out_fuel, out_distance, out_time, out_ceiling,
+                        out_limited):
+    """Fixed-step climbs for climb_segment_batch(), one per array element.
 
-        # Horizontal distance
-        cos_gamma = math.sqrt(1.0 - sin_gamma ** 2)
-        horiz_fps = V_fps * cos_gamma
-        dist_ft = horiz_fps * dt_sec
-        dist_nm = dist_ft * FT_TO_NM
+    Each case builds its altitude grid with _climb_altitude_grid() and runs
+    _climb_driver() on a scratch step buffer, so the batch shares the step
+    loop and ceiling test with climb_segment(); only the totals are written
+    into the out_* arrays. Cases share no state, so they are spread across
+    threads with prange.
+    """
+    for b in prange(W_start_lb.shape[0]):
+        if h_start_ft[b] >= h_target_ft[b]:
+            out_fuel[b] = 0.0
+            out_distance[b] = 0.0
+            out_time[b] = 0.0
+            out_ceiling[b] = h_start_ft[b]
+            out_limited[b] = False
+            continue
+
+        h_lo, dh, h_mid, V_fps, q, thrust_avail, tsfc_val = (
+            _climb_altitude_grid(
+                h_start_ft[b], h_target_ft[b], h_step_ft[b], mach_climb[b],
+                tsfc_ref[b], k_adj[b], thrust_slst_lbf[b], n_engines[b],
+            )
+        )
+        steps = np.empty((h_lo.shape[0], len(_CLIMB_COLUMNS)))
+        (_, ceiling_ft, ceiling_limited,
+         total_fuel, total_distance_nm, total_time_hr) = _climb_driver(
+            steps, W_start_lb[b], h_target_ft[b], mach_climb[b], h_lo, dh,
+            h_mid, V_fps, q, thrust_avail, tsfc_val, wing_area_ft2[b],
+            CD0[b], AR[b], e[b], roc_min_fpm[b],
+        )
 
-        # Record step
-        steps.append({
-            "h_start_ft": h_current,
-            "h_end_ft": h_current + dh,
-            "h_mid_ft": h_mid,
-            "W_start_lb": W_current,
-            "fuel_lb": fuel_this_step,
-            "distance_nm": dist_nm,
-            "time_hr": dt_hr,
-            "roc_fpm": roc_fpm,
-            "thrust_avail_lbf": thrust_avail,
-            "drag_lbf": drag_lbf,
-            "excess_thrust_lbf": excess_thrust,
-            "mach": mach_climb,
-            "CL": CL,
-        })
+        out_fuel[b] = total_fuel
+        out_distance[b] = total_distance_nm
+        out_time[b] = total_time_hr
+        out_ceiling[b] = ceiling_ft
+        out_limited[b] = ceiling_limited
 
-        # Update state
-        total_fuel += fuel_this_step
-        total_distance_nm += dist_nm
-        total_time_hr += dt_hr
-        W_current -= fuel_this_step
-        h_current += dh
+
+def climb_segment_batch(W_start_lb, h_start_ft, h_target_ft, mach_climb,
+                        wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
+                        thrust_slst_lbf, n_engines, h_step_ft=1000,
+                        roc_min_fpm=100.0):
+    """Run many fixed-step climbs at once.
+
+    Takes the same arguments as climb_segment(), but any of them may be
+    an array; all are broadcast against each other and each element is an
+    independent climb. Per-step records are not kept.
+
+    Returns:
+        dict with arrays of the broadcast shape:
+            fuel_burned_lb, distance_nm, time_hr, ceiling_ft,
+            ceiling_limited (bool)
+    """
+    args = np.broadcast_arrays(
+        W_start_lb, h_start_ft, h_target_ft, mach_climb, wing_area_ft2,
+        CD0, AR, e, tsfc_ref, k_adj, thrust_slst_lbf, n_engines, h_step_ft,
+        roc_min_fpm,
+    )
+    shape = args[0].shape
+    flat = [np.ascontiguousarray(a, dtype=np.float64).ravel() for a in args]
+    flat[11] = flat[11].astype(np.int64)  # n_engines
+
+    n = flat[0].size
+    fuel = np.empty(n)
+    distance = np.empty(n)
+    time_hr = np.empty(n)
+    ceiling = np.empty(n)
+    limited = np.empty(n, dtype=np.bool_)
+    _climb_batch_kernel(*flat, fuel, distance, time_hr, ceiling, limited)
 
     return {
-        "fuel_burned_lb": total_fuel,
-        "distance_nm": total_distance_nm,
-        "time_hr": total_time_hr,
-        "ceiling_ft": h_current,
-        "steps": steps,
-        "ceiling_limited": ceiling_limited,
+        "fuel_burned_lb": fuel.reshape(shape),
+        "distance_nm": distance.reshape(shape),
+        "time_hr": time_hr.reshape(shape),
+        "ceiling_ft": ceiling.reshape(shape),
+        "ceiling_limited": limited.reshape(shape),
     }
 
 
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _descent_kernel(W_start_lb, h_start_ft, h_target_ft, mach_descent,
+                    wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
+                    descent_rate_fpm, idle_fraction):
+    """Closed-form idle descent used by descend_segment().
+
+    Returns:
+        Tuple of (fuel_burned_lb, distance_nm, time_hr)
+    """
+    # Time to descend
+    time_hr = (h_start_ft - h_target_ft) / descent_rate_fpm / 60.0
+
+    # Cruise fuel flow at mid-descent altitude for scaling
+    h_mid = (h_start_ft + h_target_ft) / 2.0
+    drag_lbf, V_fps, CL = _level_flight_drag(
+        W_start_lb, h_mid, mach_descent, wing_area_ft2, CD0, AR, e
+    )
+    cruise_fuel_flow_lbhr = drag_lbf * propulsion.tsfc(
+        h_mid, mach_descent, tsfc_ref, k_adj
+    )
+
+    # Idle descent fuel = idle_fraction * cruise_fuel_flow * time
+    descent_fuel = idle_fraction * cruise_fuel_flow_lbhr * time_hr
+
+    # Horizontal distance: TAS at mid-descent altitude * time
+    V_ktas = V_fps * 3600.0 / NM_TO_FT
+    return descent_fuel, V_ktas * time_hr, time_hr
+
+
 def descend_segment(W_start_lb, h_start_ft, h_target_ft, mach_descent,
                      wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
                      descent_rate_fpm=2000.0, idle_fraction=0.10):
@@ -177,6 +583,11 @@ def descend_segment(W_start_lb, h_start_ft, h_target_ft, mach_descent,
     fuel flow at a representative mid-descent altitude, rather than
     the fixed 300 lb used in Mission 1.
 
+    The descent is evaluated in closed form: time follows directly from
+    the fixed descent rate, and speed and fuel flow are taken once at the
+    mid-descent altitude (a one-point midpoint rule), so there is no
+    altitude stepping to integrate.
+
     Args:
         W_start_lb: Aircraft weight at start of descent (lbf)
         h_start_ft: Starting altitude (ft)
@@ -201,28 +612,12 @@ def descend_segment(W_start_lb, h_start_ft, h_target_ft, mach_descent,
     if h_start_ft <= h_target_ft:
         return {"fuel_burned_lb": 0.0, "distance_nm": 0.0, "time_hr": 0.0}
 
-    delta_h = h_start_ft - h_target_ft
-
-    # Time to descend
-    time_min = delta_h / descent_rate_fpm
-    time_hr = time_min / 60.0
-
-    # Compute cruise fuel flow at mid-descent altitude for scaling
-    h_mid = (h_start_ft + h_target_ft) / 2.0
-    conds = performance.cruise_conditions(
-        W_start_lb, h_mid, mach_descent, wing_area_ft2,
-        CD0, AR, e, tsfc_ref, k_adj
+    descent_fuel, distance_nm, time_hr = _descent_kernel(
+        float(W_start_lb), float(h_start_ft), float(h_target_ft),
+        float(mach_descent), float(wing_area_ft2), float(CD0), float(AR),
+        float(e), float(tsfc_ref), float(k_adj), float(descent_rate_fpm),
+        float(idle_fraction),
     )
-    cruise_fuel_flow_lbhr = conds["drag_lbf"] * conds["tsfc"]
-
-    # Idle descent fuel = idle_fraction * cruise_fuel_flow * time
-    descent_fuel = idle_fraction * cruise_fuel_flow_lbhr * time_hr
-
-    # Horizontal distance: TAS at mid-descent altitude * time
-    a_mid = atmosphere.speed_of_sound(h_mid)
-    V_fps = mach_descent * a_mid
-    V_ktas = V_fps * 3600.0 / NM_TO_FT
-    distance_nm = V_ktas * time_hr
 
     return {
         "fuel_burned_lb": descent_fuel,
@@ -231,6 +626,62 @@ def descend_segment(W_start_lb, h_start_ft, h_target_ft, mach_descent,
     }
 
 
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _descent_batch_kernel(W_start_lb, h_start_ft, h_target_ft, mach_descent,
+                          wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
+                          descent_rate_fpm, idle_fraction,
+                          out_fuel, out_distance, out_time):
+    """Idle descents for descend_segment_batch(), one per array element.
+
+    Each case is a single closed-form _descent_kernel() evaluation, too
+    little work to be worth spreading across threads.
+    """
+    for b in range(W_start_lb.shape[0]):
+        if h_start_ft[b] <= h_target_ft[b]:
+            out_fuel[b] = 0.0
+            out_distance[b] = 0.0
+            out_time[b] = 0.0
+            continue
+        out_fuel[b], out_distance[b], out_time[b] = _descent_kernel(
+            W_start_lb[b], h_start_ft[b], h_target_ft[b], mach_descent[b],
+            wing_area_ft2[b], CD0[b], AR[b], e[b], tsfc_ref[b], k_adj[b],
+            descent_rate_fpm[b], idle_fraction[b],
+        )
+
+
+def descend_segment_batch(W_start_lb, h_start_ft, h_target_ft, mach_descent,
+                          wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
+                          descent_rate_fpm=2000.0, idle_fraction=0.10):
+    """Run many idle descents at once.
+
+    Takes the same arguments as descend_segment(), but any of them may be
+    an array; all are broadcast against each other and each element is an
+    independent descent.
+
+    Returns:
+        dict with arrays of the broadcast shape:
+            fuel_burned_lb, distance_nm, time_hr
+    """
+    args = np.broadcast_arrays(
+        W_start_lb, h_start_ft, h_target_ft, mach_descent, wing_area_ft2,
+        CD0, AR, e, tsfc_ref, k_adj, descent_rate_fpm, idle_fraction,
+    )
+    shape = args[0].shape
+    flat = [np.ascontiguousarray(a, dtype=np.float64).ravel() for a in args]
+
+    n = flat[0].size
+    fuel = np.empty(n)
+    distance = np.empty(n)
+    time_hr = np.empty(n)
+    _descent_batch_kernel(*flat, fuel, distance, time_hr)
+
+    return {
+        "fuel_burned_lb": fuel.reshape(shape),
+        "distance_nm": distance.reshape(shape),
+        "time_hr": time_hr.reshape(shape),
+    }
+
+
 def _find_fuel_at_distance(segments, target_range_nm):
     """Find fuel burned and weight when cumulative range reaches a target distance.
 
@@ -347,7 +798,7 @@ def simulate_mission1_engine_out(ac, cal, payload_lb=46_000, distance_nm=5050,
     # --- Step 1: Fleet sizing ---
     actual_payload = min(payload_lb, ac["max_payload"])
     if actual_payload < payload_lb:
-        n_aircraft = math.ceil(payload_lb / ac["max_payload"])
+        n_aircraft = int(-(-payload_lb // ac["max_payload"]))
         actual_payload = payload_lb / n_aircraft
     else:
         n_aircraft = 1
@@ -581,6 +1032,57 @@ def _infeasible_result(ac, cal, payload_requested, payload_actual, n_aircraft, r
     }
 
 
+def _mission2_fuel_budget(ac, cal, payload_lb):
+    """Fleet sizing and explicit-reserve fuel budget for Mission 2.
+
+    Args:
+        ac: Normalized aircraft data dict from loader
+        cal: Calibration result dict (CD0, e, k_adj, etc.)
+        payload_lb: Required total payload in lbf
+
+    Returns:
+        dict with n_aircraft, payload_actual_lb, fuel_available_lb,
+        reserve_fuel_lb, and mission_fuel_lb, plus infeasible_reason: None,
+        or a string when the mission cannot be attempted (later fields are
+        None once a check fails).
+    """
+    # --- Step 1: Fleet sizing ---
+    actual_payload = min(payload_lb, ac["max_payload"])
+    if actual_payload < payload_lb:
+        n_aircraft = int(-(-payload_lb // ac["max_payload"]))
+        actual_payload = payload_lb / n_aircraft
+    else:
+        n_aircraft = 1
+
+    budget = {
+        "n_aircraft": n_aircraft,
+        "payload_actual_lb": actual_payload,
+        "fuel_available_lb": None,
+        "reserve_fuel_lb": None,
+        "mission_fuel_lb": None,
+        "infeasible_reason": None,
+    }
+
+    # --- Step 2: Fuel available ---
+    fuel_available = min(ac["MTOW"] - ac["OEW"] - actual_payload, ac["max_fuel"])
+    if fuel_available <= 0:
+        budget["infeasible_reason"] = "Cannot carry payload within MTOW"
+        return budget
+    budget["fuel_available_lb"] = fuel_available
+
+    # --- Step 3: Fuel budget (explicit reserves, no f_oh) ---
+    reserve_fuel = performance.compute_reserve_fuel(
+        fuel_available, ac, cal["CD0"], cal["e"], cal["k_adj"]
+    )
+    mission_fuel = fuel_available - reserve_fuel
+    budget["reserve_fuel_lb"] = reserve_fuel
+    if mission_fuel <= 0:
+        budget["infeasible_reason"] = "No mission fuel after reserve deduction"
+        return budget
+    budget["mission_fuel_lb"] = mission_fuel
+    return budget
+
+
 def simulate_mission2_sampling(ac, cal, payload_lb=52_000, distance_nm=4_200,
                                 h_low_ft=5_000, max_cycles=50):
     """Simulate Mission 2: Vertical atmospheric sampling (NZCH -> SCCI).
@@ -615,35 +1117,23 @@ def simulate_mission2_sampling(ac, cal, payload_lb=52_000, distance_nm=4_200,
     """
     designation = ac["designation"]
 
-    # --- Step 1: Fleet sizing ---
-    actual_payload = min(payload_lb, ac["max_payload"])
-    if actual_payload < payload_lb:
-        n_aircraft = math.ceil(payload_lb / ac["max_payload"])
-        actual_payload = payload_lb / n_aircraft
-    else:
-        n_aircraft = 1
-
-    # --- Step 2: Fuel available ---
-    fuel_available = min(ac["MTOW"] - ac["OEW"] - actual_payload, ac["max_fuel"])
-    if fuel_available <= 0:
+    # --- Steps 1-3: Fleet sizing and fuel budget ---
+    budget = _mission2_fuel_budget(ac, cal, payload_lb)
+    n_aircraft = budget["n_aircraft"]
+    actual_payload = budget["payload_actual_lb"]
+    if budget["infeasible_reason"] is not None:
         return _infeasible_result(ac, cal, payload_lb, actual_payload, n_aircraft,
-                                  "Cannot carry payload within MTOW")
+                                  budget["infeasible_reason"])
+    fuel_available = budget["fuel_available_lb"]
+    reserve_fuel = budget["reserve_fuel_lb"]
+    mission_fuel = budget["mission_fuel_lb"]
 
     W_tow = ac["OEW"] + actual_payload + fuel_available
 
-    # --- Step 3: Fuel budget (explicit reserves, no f_oh) ---
     CD0 = cal["CD0"]
     e = cal["e"]
     k_adj = cal["k_adj"]
 
-    reserve_fuel = performance.compute_reserve_fuel(
-        fuel_available, ac, CD0, e, k_adj
-    )
-    mission_fuel = fuel_available - reserve_fuel
-    if mission_fuel <= 0:
-        return _infeasible_result(ac, cal, payload_lb, actual_payload, n_aircraft,
-                                  "No mission fuel after reserve deduction")
-
     # --- Step 4: Mission parameters ---
     # The hard ceiling is a structural/pressurization limit that the aircraft
     # must not exceed. The climb target is set higher so that climb_segment()
@@ -702,23 +1192,22 @@ def simulate_mission2_sampling(ac, cal, payload_lb=52_000, distance_nm=4_200,
         else:
             # Climbed past the hard cap — truncate at hard_ceiling
             cycle_ceiling = hard_ceiling
-            climb_fuel = 0.0
-            climb_dist = 0.0
-            climb_time = 0.0
-            for step in climb_result["steps"]:
-                if step["h_end_ft"] <= hard_ceiling:
-                    climb_fuel += step["fuel_lb"]
-                    climb_dist += step["distance_nm"]
-                    climb_time += step["time_hr"]
-                else:
-                    # Partial step crossing the hard ceiling
-                    if step["h_start_ft"] < hard_ceiling:
-                        frac = ((hard_ceiling - step["h_start_ft"])
-                                / (step["h_end_ft"] - step["h_start_ft"]))
-                        climb_fuel += step["fuel_lb"] * frac
-                        climb_dist += step["distance_nm"] * frac
-                        climb_time += step["time_hr"] * frac
-                    break
+            steps = climb_result["steps"]
+            n_full = int(np.searchsorted(steps["h_end_ft"], hard_ceiling,
+                                         side="right"))
+            full = steps[:n_full]
+            climb_fuel = float(full["fuel_lb"].sum())
+            climb_dist = float(full["distance_nm"].sum())
+            climb_time = float(full["time_hr"].sum())
+            if n_full < len(steps):
+                # Partial step crossing the hard ceiling
+                step = steps[n_full]
+                if step["h_start_ft"] < hard_ceiling:
+                    frac = float((hard_ceiling - step["h_start_ft"])
+                                 / (step["h_end_ft"] - step["h_start_ft"]))
+                    climb_fuel += float(step["fuel_lb"]) * frac
+                    climb_dist += float(step["distance_nm"]) * frac
+                    climb_time += float(step["time_hr"]) * frac
 
         # Zero-progress guard: if the aircraft can't climb above h_low
         # (e.g., because calibrated CD0 is so high that drag exceeds
@@ -1079,7 +1568,7 @@ def simulate_mission3_low_altitude(ac, cal, payload_lb=30_000,
     # --- Step 1: Fleet sizing ---
     actual_payload = min(payload_lb, ac["max_payload"])
     if actual_payload < payload_lb:
-        n_aircraft = math.ceil(payload_lb / ac["max_payload"])
+        n_aircraft = int(-(-payload_lb // ac["max_payload"]))
         actual_payload = payload_lb / n_aircraft
     else:
         n_aircraft = 1
@@ -20,14 +20,20 @@ This approach is significantly more accurate than a single-shot Breguet
 calculation, especially for long-range missions where the aircraft burns
 a large fraction of its initial weight.
 
+The scalar Breguet, specific-range and optimal-altitude computations are
+compiled with numba when it is available (see src/utils.py), and
+step_cruise_range_batch() runs many step cruises in one compiled call.
+
 See ASSUMPTIONS_LOG.md entries D1, D2, D4.
 """
 
 import math
+import numpy as np
 from src.models import atmosphere, aerodynamics, propulsion
-from src.utils import NM_TO_FT, FT_TO_NM, HR_TO_SEC
+from src.utils import njit, prange, NM_TO_FT, FT_TO_NM, HR_TO_SEC
 
 
+@njit(cache=True)
 def breguet_range_nm(V_fps, tsfc_lbplbfhr, L_D, W_initial_lb, W_final_lb):
     """Classic Breguet range equation.
 
@@ -56,6 +62,7 @@ def breguet_range_nm(V_fps, tsfc_lbplbfhr, L_D, W_initial_lb, W_final_lb):
     return range_ft * FT_TO_NM
 
 
+@njit(cache=True)
 def specific_range(V_fps, tsfc_lbplbfhr, L_D, weight_lb):
     """Compute specific range: distance per unit fuel burned.
 
@@ -77,23 +84,13 @@ def specific_range(V_fps, tsfc_lbplbfhr, L_D, weight_lb):
     return sr_ft_per_lb * FT_TO_NM
 
 
-def cruise_conditions(weight_lb, h_ft, mach, wing_area_ft2, CD0, AR, e,
-                      tsfc_ref, k_adj=1.0):
-    """Compute all relevant cruise parameters at given flight conditions.
-
-    Args:
-        weight_lb: Aircraft weight in lbf
-        h_ft: Altitude in feet
-        mach: Mach number
-        wing_area_ft2: Wing reference area in ft²
-        CD0: Zero-lift drag coefficient
-        AR: Wing aspect ratio
-        e: Oswald span efficiency factor
-        tsfc_ref: Reference cruise TSFC [lb/(lbf·hr)]
-        k_adj: TSFC calibration adjustment factor
+@njit(cache=True)
+def _cruise_point(weight_lb, h_ft, mach, wing_area_ft2, CD0, AR, e,
+                  tsfc_ref, k_adj):
+    """Compiled core of cruise_conditions().
 
     Returns:
-        dict with keys: CL, CD, L_D, V_fps, V_ktas, drag_lbf, tsfc, SR_nm_per_lb
+        Tuple of (CL, CD, L_D, V_fps, drag_lbf, tsfc, SR_nm_per_lb, q_psf)
     """
     # Atmospheric conditions
     rho = atmosphere.density(h_ft)
@@ -113,6 +110,31 @@ def cruise_conditions(weight_lb, h_ft, mach, wing_area_ft2, CD0, AR, e,
     # Specific range
     SR = specific_range(V_fps, c, L_D, weight_lb)
 
+    return CL, CD, L_D, V_fps, drag_lbf, c, SR, q
+
+
+def cruise_conditions(weight_lb, h_ft, mach, wing_area_ft2, CD0, AR, e,
+                      tsfc_ref, k_adj=1.0):
+    """Compute all relevant cruise parameters at given flight conditions.
+
+    Args:
+        weight_lb: Aircraft weight in lbf
+        h_ft: Altitude in feet
+        mach: Mach number
+        wing_area_ft2: Wing reference area in ft²
+        CD0: Zero-lift drag coefficient
+        AR: Wing aspect ratio
+        e: Oswald span efficiency factor
+        tsfc_ref: Reference cruise TSFC [lb/(lbf·hr)]
+        k_adj: TSFC calibration adjustment factor
+
+    Returns:
+        dict with keys: CL, CD, L_D, V_fps, V_ktas, drag_lbf, tsfc, SR_nm_per_lb
+    """
+    CL, CD, L_D, V_fps, drag_lbf, c, SR, q = _cruise_point(
+        weight_lb, h_ft, mach, wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj
+    )
+
     return {
         "CL": CL,
         "CD": CD,
@@ -170,41 +192,68 @@ def optimal_cruise_altitude(weight_lb, mach, wing_area_ft2, CD0, AR, e,
     Returns:
         Optimal altitude in feet
     """
-    best_alt = h_min
+    check_thrust = thrust_slst_lbf is not None and n_engines is not None
+    n_best = _optimal_altitude_steps(
+        float(weight_lb), float(mach), float(wing_area_ft2), float(CD0),
+        float(AR), float(e), float(tsfc_ref), float(k_adj), float(ceiling_ft),
+        float(thrust_slst_lbf) if check_thrust else 0.0,
+        int(n_engines) if check_thrust else 0, check_thrust,
+        float(h_min), float(h_step), float(CL_max_cruise),
+        float(drag_multiplier),
+    )
+    return h_min + n_best * h_step
+
+
+@njit(cache=True)
+def _optimal_altitude_steps(weight_lb, mach, wing_area_ft2, CD0, AR, e,
+                            tsfc_ref, k_adj, ceiling_ft, thrust_slst_lbf,
+                            n_engines, check_thrust, h_min, h_step,
+                            CL_max_cruise, drag_multiplier):
+    """Altitude search for optimal_cruise_altitude().
+
+    Returns:
+        Number of h_step increments above h_min of the best altitude, so
+        the caller can rebuild it in the type of its own h_min/h_step.
+    """
+    n_best = 0
     best_sr = 0.0
 
+    n = 0
     h = h_min
     while h <= ceiling_ft:
-        conds = cruise_conditions(weight_lb, h, mach, wing_area_ft2,
-                                  CD0, AR, e, tsfc_ref, k_adj)
+        CL, CD, L_D, V_fps, drag_lbf, c, SR, q = _cruise_point(
+            weight_lb, h, mach, wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj
+        )
 
         # Check CL limit (buffet boundary)
-        if conds["CL"] > CL_max_cruise:
+        if CL > CL_max_cruise:
             # CL too high at this altitude — can't go higher
             break
 
         # Check thrust available if engine data provided
-        if thrust_slst_lbf is not None and n_engines is not None:
+        if check_thrust:
             thrust_avail = propulsion.thrust_available_cruise(
                 thrust_slst_lbf, h, n_engines
             )
-            if thrust_avail < conds["drag_lbf"] * drag_multiplier:
+            if thrust_avail < drag_lbf * drag_multiplier:
                 # Can't sustain flight at this altitude — skip but keep searching.
                 # Unlike CL (monotonically increasing with altitude), the
                 # thrust-drag balance is non-monotonic: at low altitudes high
                 # dynamic pressure can make drag exceed thrust, while at
                 # mid-altitudes the balance may be favorable before thrust
                 # lapse dominates at high altitudes.
-                h += h_step
+                n += 1
+                h = h_min + n * h_step
                 continue
 
-        if conds["SR_nm_per_lb"] > best_sr:
-            best_sr = conds["SR_nm_per_lb"]
-            best_alt = h
+        if SR > best_sr:
+            best_sr = SR
+            n_best = n
 
-        h += h_step
+        n += 1
+        h = h_min + n * h_step
 
-    return best_alt
+    return n_best
 
 
 def step_cruise_range(W_initial_lb, fuel_available_lb, mach, wing_area_ft2,
@@ -316,6 +365,119 @@ def step_cruise_range(W_initial_lb, fuel_available_lb, mach, wing_area_ft2,
     }
 
 
+@njit(cache=True)
+def _step_cruise_totals(W_initial_lb, fuel_available_lb, mach, wing_area_ft2,
+                        CD0, AR, e, tsfc_ref, k_adj, ceiling_ft,
+                        thrust_slst_lbf, n_engines, check_thrust, n_steps,
+                        fixed_altitude_ft, drag_multiplier, CL_max_cruise,
+                        h_min):
+    """step_cruise_range() without the per-segment records.
+
+    fixed_altitude_ft is NaN to search for the optimal altitude each step.
+
+    Returns:
+        Tuple of (range_nm, fuel_burned_lb)
+    """
+    fuel_per_step = fuel_available_lb / n_steps
+    total_range = 0.0
+    total_fuel = 0.0
+    W_current = W_initial_lb
+
+    for i in range(n_steps):
+        W_start = W_current
+        W_end = W_current - fuel_per_step
+        if W_end <= 0:
+            break
+
+        if math.isnan(fixed_altitude_ft):
+            # 500 ft search step, optimal_cruise_altitude()'s default
+            h = h_min + 500.0 * _optimal_altitude_steps(
+                W_start, mach, wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
+                ceiling_ft, thrust_slst_lbf, n_engines, check_thrust,
+                h_min, 500.0, CL_max_cruise, drag_multiplier,
+            )
+        else:
+            h = fixed_altitude_ft
+
+        W_mid = (W_start + W_end) / 2.0
+        CL, CD, L_D, V_fps, drag_lbf, c, SR, q = _cruise_point(
+            W_mid, h, mach, wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj
+        )
+        total_range += breguet_range_nm(
+            V_fps, c, L_D / drag_multiplier, W_start, W_end
+        )
+        total_fuel += fuel_per_step
+        W_current = W_end
+
+    return total_range, total_fuel
+
+
+@njit(cache=True, parallel=True)
+def _step_cruise_batch_kernel(W_initial_lb, fuel_available_lb, mach,
+                              wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj,
+                              ceiling_ft, thrust_slst_lbf, n_engines,
+                              check_thrust, n_steps, fixed_altitude_ft,
+                              drag_multiplier, CL_max_cruise, h_min,
+                              out_range, out_fuel):
+    """Step cruises for step_cruise_range_batch(), one per array element.
+
+    Cases share no state, so they are spread across threads with prange.
+    """
+    for b in prange(W_initial_lb.shape[0]):
+        out_range[b], out_fuel[b] = _step_cruise_totals(
+            W_initial_lb[b], fuel_available_lb[b], mach[b], wing_area_ft2[b],
+            CD0[b], AR[b], e[b], tsfc_ref[b], k_adj[b], ceiling_ft[b],
+            thrust_slst_lbf[b], n_engines[b], check_thrust, n_steps,
+            fixed_altitude_ft[b], drag_multiplier[b], CL_max_cruise[b],
+            h_min[b],
+        )
+
+
+def step_cruise_range_batch(W_initial_lb, fuel_available_lb, mach,
+                            wing_area_ft2, CD0, AR, e, tsfc_ref, k_adj=1.0,
+                            ceiling_ft=43_000, thrust_slst_lbf=None,
+                            n_engines=None, n_steps=50, fixed_altitude_ft=None,
+                            drag_multiplier=1.0, CL_max_cruise=0.60,
+                            h_min=25_000):
+    """Run many step cruises at once.
+
+    Takes the same arguments as step_cruise_range(), but any numeric one
+    except n_steps may be an array; all are broadcast against each other
+    and each element is an independent cruise. thrust_slst_lbf, n_engines
+    and fixed_altitude_ft are either given or None for the whole batch.
+    Per-segment records are not kept.
+
+    Returns:
+        dict with arrays of the broadcast shape:
+            range_nm, fuel_burned_lb
+    """
+    check_thrust = thrust_slst_lbf is not None and n_engines is not None
+    if not check_thrust:
+        thrust_slst_lbf, n_engines = 0.0, 0
+    if fixed_altitude_ft is None:
+        fixed_altitude_ft = np.nan
+
+    args = np.broadcast_arrays(
+        W_initial_lb, fuel_available_lb, mach, wing_area_ft2, CD0, AR, e,
+        tsfc_ref, k_adj, ceiling_ft, thrust_slst_lbf, n_engines,
+        fixed_altitude_ft, drag_multiplier, CL_max_cruise, h_min,
+    )
+    shape = args[0].shape
+    flat = [np.ascontiguousarray(a, dtype=np.float64).ravel() for a in args]
+    flat[11] = flat[11].astype(np.int64)  # n_engines
+
+    n = flat[0].size
+    range_nm = np.empty(n)
+    fuel = np.empty(n)
+    _step_cruise_batch_kernel(*flat[:12], check_thrust, int(n_steps),
+                              *flat[12:], range_nm, fuel)
+
+    return {
+        "range_nm": range_nm.reshape(shape),
+        "fuel_burned_lb": fuel.reshape(shape),
+    }
+
+
 def estimate_climb_fuel(W_lb, h_cruise_ft, aircraft_data, CD0, AR, e,
                         tsfc_ref, k_adj=1.0):
     """Estimate fuel consumed climbing from sea level to cruise altitude.
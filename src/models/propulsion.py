@@ -20,6 +20,9 @@ stabilizes.
 The Mach correction captures the ram effect on inlet temperature and the
 velocity-dependent momentum drag of the bypass stream.
 
+The TSFC and thrust-lapse functions used inside the mission integrators are
+compiled with numba when it is available (see src/utils.py).
+
 See ASSUMPTIONS_LOG.md entries C1, C2, C3.
 
 References:
@@ -29,6 +32,7 @@ References:
 
 import math
 from src.models import atmosphere
+from src.utils import njit
 
 
 # --- Reference conditions for TSFC_ref values ---
@@ -47,6 +51,7 @@ THRUST_LAPSE_EXPONENT_TROPO = 0.75
 THRUST_LAPSE_EXPONENT_STRATO = 2.0
 
 
+@njit(cache=True)
 def altitude_factor(h_ft, ref_alt_ft=TSFC_REF_ALT_FT):
     """Altitude correction factor for TSFC.
 
@@ -72,6 +77,7 @@ def altitude_factor(h_ft, ref_alt_ft=TSFC_REF_ALT_FT):
     return math.sqrt(theta / theta_ref)
 
 
+@njit(cache=True)
 def mach_factor(mach, ref_mach=TSFC_REF_MACH):
     """Mach number correction factor for TSFC.
 
@@ -96,6 +102,7 @@ def mach_factor(mach, ref_mach=TSFC_REF_MACH):
     return 1.0 + K_MACH * (mach - ref_mach)
 
 
+@njit(cache=True)
 def tsfc(h_ft, mach, tsfc_ref, k_adj=1.0, ref_alt_ft=TSFC_REF_ALT_FT,
          ref_mach=TSFC_REF_MACH):
     """Compute TSFC at given flight conditions.
@@ -137,6 +144,7 @@ def fuel_flow_rate(thrust_lbf, h_ft, mach, tsfc_ref, k_adj=1.0):
     return thrust_lbf * c
 
 
+@njit(cache=True)
 def thrust_available_cruise(thrust_slst_lbf, h_ft, n_engines=1):
     """Estimate available cruise thrust at altitude.
 
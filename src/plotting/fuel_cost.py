@@ -11,7 +11,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import os
 
-from src.plotting.range_payload import AIRCRAFT_COLORS
+from src.plotting.range_payload import AIRCRAFT_COLORS, PNG_METADATA
 
 STUDY_ORDER = ["DC-8", "GV", "P-8", "767-200ER", "A330-200", "777-200LR"]
 
@@ -161,7 +161,8 @@ def plot_fuel_cost_comparison(m1_results, m2_results, m3_results, output_path):
              ha='center', fontsize=8, style='italic', color='#555555')
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {output_path}")
     return output_path
@@ -13,7 +13,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 import os
 
-from src.plotting.range_payload import AIRCRAFT_COLORS, AIRCRAFT_MARKERS
+from src.plotting.range_payload import (
+    AIRCRAFT_COLORS, AIRCRAFT_MARKERS, PNG_METADATA,
+)
 
 STUDY_ORDER = ["DC-8", "GV", "P-8", "767-200ER", "A330-200", "777-200LR"]
 
@@ -106,7 +108,8 @@ def plot_mission1_altitude(results, output_path):
     ax.set_ylim(0, None)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {output_path}")
     return output_path
@@ -162,7 +165,8 @@ def plot_mission1_mach(results, output_path):
     ax.set_xlim(0, None)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {output_path}")
     return output_path
@@ -216,7 +220,8 @@ def plot_mission2_altitude(results, output_path):
     ax.set_ylim(0, None)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {output_path}")
     return output_path
@@ -267,7 +272,8 @@ def plot_mission2_ceiling_progression(results, output_path):
     ax.set_ylim(bottom=35)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {output_path}")
     return output_path
@@ -34,6 +34,9 @@ AIRCRAFT_MARKERS = {
     "777-200LR": "*",
 }
 
+# PNG text chunks to write (None drops matplotlib's default Software entry)
+PNG_METADATA = {"Software": None, "Creation Time": None}
+
 
 def generate_rp_curve(aircraft_data, cal_result, n_points=40, n_steps=30):
     """Generate range-payload curve data points.
@@ -134,7 +137,8 @@ def plot_individual_rp(aircraft_data, cal_result, output_dir="outputs/plots"):
 
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, f"rp_{designation.replace('-', '').replace(' ', '_').lower()}.png")
-    fig.savefig(filepath, dpi=150, bbox_inches='tight')
+    fig.savefig(filepath, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {filepath}")
     return filepath
@@ -192,7 +196,8 @@ def plot_overlay_rp(all_aircraft_data, all_calibrations, output_dir="outputs/plo
 
     os.makedirs(output_dir, exist_ok=True)
     filepath = os.path.join(output_dir, "rp_overlay_all.png")
-    fig.savefig(filepath, dpi=150, bbox_inches='tight')
+    fig.savefig(filepath, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {filepath}")
     return filepath
@@ -16,7 +16,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import os
 
-from src.plotting.range_payload import AIRCRAFT_COLORS
+from src.plotting.range_payload import AIRCRAFT_COLORS, PNG_METADATA
 
 # Study candidates in display order
 STUDY_ORDER = ["DC-8", "GV", "P-8", "767-200ER", "A330-200", "777-200LR"]
@@ -27,7 +27,11 @@ def _build_bar_data(results):
 
     Returns a list of dicts, one per bar to display. Aircraft with
     n_aircraft > 1 get two entries: one per-aircraft and one aggregate.
+    If results is already a list of bar records, it is returned as-is.
     """
+    if isinstance(results, list):
+        return results
+
     bars = []
     for d in STUDY_ORDER:
         r = results[d]
@@ -98,7 +102,8 @@ def plot_weight_breakdown(results, mission_title, output_path,
     """Plot stacked weight breakdown bar chart for one mission.
 
     Args:
-        results: dict keyed by designation -> mission result dict
+        results: dict keyed by designation -> mission result dict, or a
+            prebuilt list of bar records in the _build_bar_data format
         mission_title: Title string for the plot
         output_path: Full path for the output PNG file
         fuel_budget_note: Optional one-line note about fuel budget method,
@@ -124,18 +129,22 @@ def plot_weight_breakdown(results, mission_title, output_path,
     width = 0.7
 
     labels = [b["label"] for b in bars]
-    oew = np.array([b["oew"] for b in bars]) / 1000
-    payload = np.array([b["payload"] for b in bars]) / 1000
-    mission_fuel = np.array([b["mission_fuel"] for b in bars]) / 1000
-    reserve_fuel = np.array([b["reserve_fuel"] for b in bars]) / 1000
+
+    # One (4, n_bars) buffer scaled to klb in place; rows are views into it
+    weights = np.empty((4, n_bars))
+    for row, key in enumerate(("oew", "payload", "mission_fuel", "reserve_fuel")):
+        weights[row] = [b[key] for b in bars]
+    np.multiply(weights, 1e-3, out=weights)
+    oew, payload, mission_fuel, reserve_fuel = weights
+    tops = np.cumsum(weights, axis=0)
 
     # Stacked bars
     p1 = ax.bar(x, oew, width, label="OEW", color="#7f7f7f", edgecolor="white")
     p2 = ax.bar(x, payload, width, bottom=oew,
                 label="Payload", color="#2ca02c", edgecolor="white")
-    p3 = ax.bar(x, mission_fuel, width, bottom=oew + payload,
+    p3 = ax.bar(x, mission_fuel, width, bottom=tops[1],
                 label="Mission Fuel", color="#ff7f0e", edgecolor="white")
-    p4 = ax.bar(x, reserve_fuel, width, bottom=oew + payload + mission_fuel,
+    p4 = ax.bar(x, reserve_fuel, width, bottom=tops[2],
                 label=remaining_fuel_label, color="#d62728", edgecolor="white",
                 alpha=0.7)
 
@@ -148,7 +157,7 @@ def plot_weight_breakdown(results, mission_title, output_path,
                 p[i].set_linewidth(0.5)
 
     # Total weight annotation on top of each bar
-    totals = oew + payload + mission_fuel + reserve_fuel
+    totals = tops[3]
     for i, total in enumerate(totals):
         ax.text(i, total + max(totals) * 0.01,
                 f"{total:.0f}k",
@@ -169,7 +178,8 @@ def plot_weight_breakdown(results, mission_title, output_path,
                  ha='center', fontsize=8.5, style='italic', color='#555555')
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    fig.savefig(output_path, dpi=150, bbox_inches='tight')
+    fig.savefig(output_path, dpi=150, bbox_inches='tight',
+                metadata=PNG_METADATA)
     plt.close(fig)
     print(f"  Saved: {output_path}")
     return output_path
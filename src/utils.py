@@ -1,5 +1,16 @@
 """Unit conversions and common utilities for aircraft performance modeling."""
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional — fall back to plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
 
 # --- Physical Constants ---
 G = 32.174  # gravitational acceleration, ft/s^2
@@ -0,0 +1,46 @@
+"""Shared pytest configuration for the test suite."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture(scope="session")
+def all_aircraft():
+    """Normalized data for every study aircraft, keyed by designation."""
+    from src.aircraft_data.loader import load_all_aircraft
+    return load_all_aircraft()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prime_missions():
+    """Load the compiled mission kernels before any test runs.
+
+    The numba kernels are cached on disk (cache=True), but each process
+    still pays to load or, on a cold cache, compile them on first call.
+    A short fixed-step, adaptive and batched climb and a scalar and batched
+    descent here move that cost out of the first test of each kind.
+    As a session fixture it runs once in each process that runs tests,
+    including each pytest-xdist worker, and not in the xdist controller.
+    """
+    from src.models.missions import (
+        climb_segment, climb_segment_batch, descend_segment,
+        descend_segment_batch,
+    )
+
+    aircraft = dict(wing_area_ft2=3050.0, CD0=0.02, AR=7.9, e=0.8,
+                    tsfc_ref=0.6, k_adj=1.0)
+    climb = dict(W_start_lb=200_000, h_start_ft=10_000, h_target_ft=11_000,
+                 mach_climb=0.76, thrust_slst_lbf=60_000.0, n_engines=2,
+                 **aircraft)
+    descent = dict(W_start_lb=200_000, h_start_ft=11_000, h_target_ft=10_000,
+                   mach_descent=0.72, **aircraft)
+
+    climb_segment(h_step_ft=1000, **climb)
+    climb_segment(h_step_ft=None, **climb)
+    climb_segment_batch(**climb)
+    descend_segment(**descent)
+    descend_segment_batch(**descent)
@@ -4,121 +4,196 @@ Tests climb_segment(), descend_segment(), simulate_mission2_sampling(),
 and simulate_mission3_low_altitude() using synthetic aircraft parameters
 for fast execution (no calibration needed).
 """
-import sys
-sys.path.insert(0, '.')
-
 import pytest
 import math
+import numpy as np
+from collections import ChainMap
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType, SimpleNamespace
 from src.models.missions import (
-    climb_segment, descend_segment,
+    climb_segment, climb_segment_batch, descend_segment, descend_segment_batch,
     simulate_mission2_sampling, simulate_mission3_low_altitude,
+    _mission2_fuel_budget,
 )
 
 
 # --- Synthetic aircraft parameters for testing ---
 # These are representative of a 767-class aircraft but use round numbers
 # for predictability. They do NOT need to match any calibrated aircraft.
-SYNTH_WING_AREA = 3050.0       # ft^2
-SYNTH_AR = 7.9                 # aspect ratio
-SYNTH_CD0 = 0.020              # realistic zero-lift drag
-SYNTH_E = 0.80                 # Oswald efficiency
-SYNTH_TSFC_REF = 0.60          # lb/(lbf-hr) reference TSFC
-SYNTH_K_ADJ = 1.0              # no TSFC adjustment
-SYNTH_THRUST_SLST = 60_000.0   # lbf per engine (sea-level static)
-SYNTH_N_ENGINES = 2
-SYNTH_MACH_CLIMB = 0.76        # climb Mach (cruise_mach * 0.95)
-SYNTH_MACH_DESCENT = 0.72      # descent Mach
+SYNTH = SimpleNamespace(
+    wing_area_ft2=3050.0,      # ft^2
+    AR=7.9,                    # aspect ratio
+    CD0=0.020,                 # realistic zero-lift drag
+    e=0.80,                    # Oswald efficiency
+    tsfc_ref=0.60,             # lb/(lbf-hr) reference TSFC
+    k_adj=1.0,                 # no TSFC adjustment
+    thrust_slst_lbf=60_000.0,  # lbf per engine (sea-level static)
+    n_engines=2,
+    mach_climb=0.76,           # climb Mach (cruise_mach * 0.95)
+    mach_descent=0.72,         # descent Mach
+)
+
+# Segment functions with the synthetic aircraft bound; tests pass only the
+# weight and altitudes, plus any parameter they override.
+_climb = partial(
+    climb_segment,
+    mach_climb=SYNTH.mach_climb, wing_area_ft2=SYNTH.wing_area_ft2,
+    CD0=SYNTH.CD0, AR=SYNTH.AR, e=SYNTH.e,
+    tsfc_ref=SYNTH.tsfc_ref, k_adj=SYNTH.k_adj,
+    thrust_slst_lbf=SYNTH.thrust_slst_lbf, n_engines=SYNTH.n_engines,
+)
+_climb_batch = partial(
+    climb_segment_batch,
+    mach_climb=SYNTH.mach_climb, wing_area_ft2=SYNTH.wing_area_ft2,
+    CD0=SYNTH.CD0, AR=SYNTH.AR, e=SYNTH.e,
+    tsfc_ref=SYNTH.tsfc_ref, k_adj=SYNTH.k_adj,
+    thrust_slst_lbf=SYNTH.thrust_slst_lbf, n_engines=SYNTH.n_engines,
+)
+_descend = partial(
+    descend_segment,
+    mach_descent=SYNTH.mach_descent, wing_area_ft2=SYNTH.wing_area_ft2,
+    CD0=SYNTH.CD0, AR=SYNTH.AR, e=SYNTH.e,
+    tsfc_ref=SYNTH.tsfc_ref, k_adj=SYNTH.k_adj,
+)
+_descend_batch = partial(
+    descend_segment_batch,
+    mach_descent=SYNTH.mach_descent, wing_area_ft2=SYNTH.wing_area_ft2,
+    CD0=SYNTH.CD0, AR=SYNTH.AR, e=SYNTH.e,
+    tsfc_ref=SYNTH.tsfc_ref, k_adj=SYNTH.k_adj,
+)
+
+
+# --- Shared segment results ---
+# Several tests only assert on the same baseline integration, so each one is
+# run once per test session rather than once per test.
+
+@pytest.fixture(scope="session")
+def baseline_climb():
+    """Climb from 5,000 to 35,000 ft at 250,000 lb."""
+    return _climb(W_start_lb=250_000, h_start_ft=5_000, h_target_ft=35_000)
+
+
+@pytest.fixture(scope="session")
+def baseline_climb_40k():
+    """Climb from 5,000 to 40,000 ft at 250,000 lb."""
+    return _climb(W_start_lb=250_000, h_start_ft=5_000, h_target_ft=40_000)
+
+
+@pytest.fixture(scope="session")
+def baseline_climb_300k():
+    """Climb from 5,000 to 35,000 ft at 300,000 lb."""
+    return _climb(W_start_lb=300_000, h_start_ft=5_000, h_target_ft=35_000)
+
+
+@pytest.fixture(scope="session")
+def baseline_descend():
+    """Descent from 35,000 to 5,000 ft at 250,000 lb and 2,000 ft/min."""
+    return _descend(W_start_lb=250_000, h_start_ft=35_000, h_target_ft=5_000,
+                    descent_rate_fpm=2000.0)
+
+
+@pytest.fixture(scope="session")
+def climb_matrix():
+    """Climbs to 55,000 ft compared against each other by ceiling.
+
+    All cases run in one climb_segment_batch() call.
+    """
+    cases = {
+        "very_heavy_400k": dict(W_start_lb=400_000),
+        "heavy_350k": dict(W_start_lb=350_000),
+        "light_200k": dict(W_start_lb=200_000),
+        "normal_cd0_300k": dict(W_start_lb=300_000, CD0=0.020),
+        "high_cd0_300k": dict(W_start_lb=300_000, CD0=0.050),
+    }
+    batch = _climb_batch(
+        W_start_lb=[c["W_start_lb"] for c in cases.values()],
+        h_start_ft=5_000, h_target_ft=55_000,
+        CD0=[c.get("CD0", SYNTH.CD0) for c in cases.values()],
+    )
+    return {
+        name: {key: values[i] for key, values in batch.items()}
+        for i, name in enumerate(cases)
+    }
+
+
+@pytest.fixture(scope="session")
+def descend_matrix():
+    """Descents to 5,000 ft compared against each other.
+
+    All cases run in one descend_segment_batch() call.
+    """
+    cases = {
+        "drop_20k": dict(W_start_lb=250_000, h_start_ft=25_000),
+        "drop_35k": dict(W_start_lb=250_000, h_start_ft=40_000),
+        "light_150k": dict(W_start_lb=150_000, h_start_ft=35_000),
+        "heavy_350k": dict(W_start_lb=350_000, h_start_ft=35_000),
+    }
+    batch = _descend_batch(
+        W_start_lb=[c["W_start_lb"] for c in cases.values()],
+        h_start_ft=[c["h_start_ft"] for c in cases.values()],
+        h_target_ft=5_000,
+    )
+    return {
+        name: {key: values[i] for key, values in batch.items()}
+        for i, name in enumerate(cases)
+    }
 
 
 class TestClimbSegment:
     """Tests for climb_segment()."""
 
-    def test_returns_positive_fuel_and_distance(self):
-        result = climb_segment(
-            W_start_lb=300_000, h_start_ft=5_000, h_target_ft=35_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        assert result["fuel_burned_lb"] > 0
-        assert result["distance_nm"] > 0
-        assert result["time_hr"] > 0
+    def test_returns_positive_fuel_and_distance(self, baseline_climb_300k):
+        assert baseline_climb_300k["fuel_burned_lb"] > 0
+        assert baseline_climb_300k["distance_nm"] > 0
+        assert baseline_climb_300k["time_hr"] > 0
 
-    def test_ceiling_reached_matches_target(self):
+    def test_ceiling_reached_matches_target(self, baseline_climb):
         """When thrust is sufficient, climb should reach target altitude."""
-        result = climb_segment(
-            W_start_lb=250_000, h_start_ft=5_000, h_target_ft=35_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        assert result["ceiling_ft"] == pytest.approx(35_000, abs=1)
-        assert result["ceiling_limited"] is False
+        assert baseline_climb["ceiling_ft"] == pytest.approx(35_000, abs=1)
+        assert baseline_climb["ceiling_limited"] is False
 
     def test_ceiling_limited_at_heavy_weight(self):
         """Very heavy aircraft should hit ceiling before target."""
         # Use a very heavy weight with modest thrust to force ceiling limit
-        result = climb_segment(
+        result = _climb(
             W_start_lb=400_000, h_start_ft=5_000, h_target_ft=55_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
         )
         assert result["ceiling_ft"] < 55_000
         assert result["ceiling_limited"] is True
 
-    def test_lighter_aircraft_reaches_higher(self):
-        """Lighter aircraft should achieve a higher ceiling."""
-        heavy = climb_segment(
-            W_start_lb=350_000, h_start_ft=5_000, h_target_ft=55_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        light = climb_segment(
-            W_start_lb=200_000, h_start_ft=5_000, h_target_ft=55_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        assert light["ceiling_ft"] > heavy["ceiling_ft"]
+    @pytest.mark.parametrize("lower, higher", [
+        pytest.param("heavy_350k", "light_200k", id="lighter_reaches_higher"),
+        pytest.param("high_cd0_300k", "normal_cd0_300k",
+                     id="high_cd0_reduces_ceiling"),
+    ])
+    def test_ceiling_ordering(self, climb_matrix, lower, higher):
+        """Lighter aircraft should achieve a higher ceiling.
+
+        Unrealistically high CD0 (like calibrated P-8/A330) should reduce
+        ceiling.
+        """
+        assert climb_matrix[higher]["ceiling_ft"] > climb_matrix[lower]["ceiling_ft"]
 
     def test_no_climb_when_start_equals_target(self):
-        result = climb_segment(
+        result = _climb(
             W_start_lb=250_000, h_start_ft=35_000, h_target_ft=35_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
         )
         assert result["fuel_burned_lb"] == 0.0
         assert result["distance_nm"] == 0.0
-        assert result["steps"] == []
+        assert len(result["steps"]) == 0
 
     def test_no_climb_when_start_above_target(self):
-        result = climb_segment(
+        result = _climb(
             W_start_lb=250_000, h_start_ft=40_000, h_target_ft=35_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
         )
         assert result["fuel_burned_lb"] == 0.0
 
     def test_steps_cover_full_altitude_range(self):
         """Each step should cover the expected altitude increment."""
         h_start, h_target = 5_000, 25_000
-        result = climb_segment(
+        result = _climb(
             W_start_lb=250_000, h_start_ft=h_start, h_target_ft=h_target,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
             h_step_ft=1000,
         )
         # Should have 20 steps for 20,000 ft at 1,000 ft steps
@@ -127,266 +202,287 @@ class TestClimbSegment:
             assert result["steps"][0]["h_start_ft"] == h_start
             assert result["steps"][-1]["h_end_ft"] == h_target
 
-    def test_weight_decreases_through_climb(self):
-        result = climb_segment(
-            W_start_lb=250_000, h_start_ft=5_000, h_target_ft=35_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        steps = result["steps"]
+    def test_weight_decreases_through_climb(self, baseline_climb):
+        steps = baseline_climb["steps"]
         if len(steps) >= 2:
             assert steps[-1]["W_start_lb"] < steps[0]["W_start_lb"]
 
-    def test_roc_decreases_with_altitude(self):
+    def test_roc_decreases_with_altitude(self, baseline_climb_40k):
         """Rate of climb should generally decrease as altitude increases."""
-        result = climb_segment(
-            W_start_lb=250_000, h_start_ft=5_000, h_target_ft=40_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        steps = result["steps"]
-        if len(steps) >= 5:
+        roc = baseline_climb_40k["steps"]["roc_fpm"]
+        if roc.size >= 5:
             # Compare first few steps to last few — ROC should trend down
-            early_roc = sum(s["roc_fpm"] for s in steps[:3]) / 3
-            late_roc = sum(s["roc_fpm"] for s in steps[-3:]) / 3
-            assert late_roc < early_roc
-
-    def test_fuel_burned_reasonable_magnitude(self):
+            assert roc[-3:].mean() < roc[:3].mean()
+
+    def test_float32_steps_match_float64(self, baseline_climb):
+        """precision="f4" stores float32 step records; totals are unchanged."""
+        result = _climb(W_start_lb=250_000, h_start_ft=5_000,
+                        h_target_ft=35_000, precision="f4")
+        assert result["steps"]["roc_fpm"].dtype == np.float32
+        assert result["fuel_burned_lb"] == baseline_climb["fuel_burned_lb"]
+        assert result["steps"]["fuel_lb"] == pytest.approx(
+            baseline_climb["steps"]["fuel_lb"], rel=1e-6)
+
+    def test_adaptive_steps_match_fine_fixed_steps(self):
+        """h_step_ft=None should track a fine fixed-step climb in fewer steps."""
+        fine = _climb(W_start_lb=250_000, h_start_ft=5_000,
+                      h_target_ft=35_000, h_step_ft=100)
+        adaptive = _climb(W_start_lb=250_000, h_start_ft=5_000,
+                          h_target_ft=35_000, h_step_ft=None)
+        assert adaptive["ceiling_ft"] == pytest.approx(35_000, abs=1)
+        assert adaptive["fuel_burned_lb"] == pytest.approx(
+            fine["fuel_burned_lb"], rel=0.005)
+        assert adaptive["distance_nm"] == pytest.approx(
+            fine["distance_nm"], rel=0.005)
+        assert len(adaptive["steps"]) < 30
+        assert adaptive["steps"]["h_end_ft"][-1] == 35_000
+
+    def test_adaptive_minimum_steps_stay_in_buffer(self):
+        """Minimum-size steps from a fractional altitude should end at the
+        target without a rounding-residue step."""
+        h_start, h_target = 5_000.1, 9_000.3
+        result = _climb(W_start_lb=250_000, h_start_ft=h_start,
+                        h_target_ft=h_target, h_step_ft=None,
+                        tol_fuel_lb=1e-9)
+        assert not result["ceiling_limited"]
+        assert len(result["steps"]) == math.ceil((h_target - h_start) / 100)
+        assert result["steps"]["h_end_ft"][-1] == pytest.approx(h_target)
+
+    def test_fuel_burned_reasonable_magnitude(self, baseline_climb_300k):
         """Climb fuel for a 30,000 ft climb should be in the ballpark of
         a few thousand pounds for a 767-class aircraft."""
-        result = climb_segment(
-            W_start_lb=300_000, h_start_ft=5_000, h_target_ft=35_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
         # Expect roughly 2,000–8,000 lb for this configuration
-        assert 1_000 < result["fuel_burned_lb"] < 15_000
-
-    def test_high_cd0_reduces_ceiling(self):
-        """Unrealistically high CD0 (like calibrated P-8/A330) should reduce ceiling."""
-        normal = climb_segment(
-            W_start_lb=300_000, h_start_ft=5_000, h_target_ft=55_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=0.020, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        high_cd0 = climb_segment(
-            W_start_lb=300_000, h_start_ft=5_000, h_target_ft=55_000,
-            mach_climb=SYNTH_MACH_CLIMB, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=0.050, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            thrust_slst_lbf=SYNTH_THRUST_SLST, n_engines=SYNTH_N_ENGINES,
-        )
-        assert high_cd0["ceiling_ft"] < normal["ceiling_ft"]
+        assert 1_000 < baseline_climb_300k["fuel_burned_lb"] < 15_000
+
+
+class TestClimbSegmentBatch:
+    """Tests for climb_segment_batch()."""
+
+    def test_matches_climb_segment(self):
+        """Each batch element should reproduce the scalar climb_segment()."""
+        W = np.array([250_000.0, 400_000.0, 300_000.0, 250_000.0])
+        h_start = np.array([5_000.0, 5_000.0, 5_000.0, 40_000.0])
+        h_target = np.array([35_000.0, 55_000.0, 55_000.0, 35_000.0])
+        CD0 = np.array([SYNTH.CD0, SYNTH.CD0, 0.050, SYNTH.CD0])
+        batch = _climb_batch(W_start_lb=W, h_start_ft=h_start,
+                             h_target_ft=h_target, CD0=CD0)
+        for i in range(W.size):
+            single = _climb(W_start_lb=W[i], h_start_ft=h_start[i],
+                            h_target_ft=h_target[i], CD0=CD0[i])
+            for key in ("fuel_burned_lb", "distance_nm", "time_hr",
+                        "ceiling_ft"):
+                assert batch[key][i] == pytest.approx(single[key], rel=1e-9)
+            assert batch["ceiling_limited"][i] == single["ceiling_limited"]
+
+    def test_ceiling_limited_at_heavy_weight(self, climb_matrix):
+        """The heavy climb in the batch should also be ceiling limited."""
+        result = climb_matrix["very_heavy_400k"]
+        assert result["ceiling_ft"] < 55_000
+        assert bool(result["ceiling_limited"]) is True
+
+    def test_broadcasts_to_input_shape(self):
+        W = np.array([[200_000.0], [300_000.0]])
+        CD0 = np.array([0.020, 0.030, 0.040])
+        batch = _climb_batch(W_start_lb=W, h_start_ft=5_000,
+                             h_target_ft=35_000, CD0=CD0)
+        assert batch["ceiling_ft"].shape == (2, 3)
+        assert batch["ceiling_limited"].dtype == bool
 
 
 class TestDescendSegment:
     """Tests for descend_segment()."""
 
-    def test_returns_positive_values(self):
-        result = descend_segment(
-            W_start_lb=250_000, h_start_ft=35_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-        )
-        assert result["fuel_burned_lb"] > 0
-        assert result["distance_nm"] > 0
-        assert result["time_hr"] > 0
+    def test_returns_positive_values(self, baseline_descend):
+        assert baseline_descend["fuel_burned_lb"] > 0
+        assert baseline_descend["distance_nm"] > 0
+        assert baseline_descend["time_hr"] > 0
 
     def test_no_descent_when_already_at_target(self):
-        result = descend_segment(
+        result = _descend(
             W_start_lb=250_000, h_start_ft=5_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
         )
         assert result["fuel_burned_lb"] == 0.0
         assert result["distance_nm"] == 0.0
 
     def test_no_descent_when_below_target(self):
-        result = descend_segment(
+        result = _descend(
             W_start_lb=250_000, h_start_ft=3_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
         )
         assert result["fuel_burned_lb"] == 0.0
 
-    def test_larger_altitude_drop_more_fuel(self):
-        short = descend_segment(
-            W_start_lb=250_000, h_start_ft=25_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-        )
-        long = descend_segment(
-            W_start_lb=250_000, h_start_ft=40_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-        )
-        assert long["fuel_burned_lb"] > short["fuel_burned_lb"]
-        assert long["distance_nm"] > short["distance_nm"]
-
-    def test_descent_fuel_scales_with_aircraft_size(self):
-        """Heavier aircraft (higher drag) should burn more fuel descending."""
-        light = descend_segment(
-            W_start_lb=150_000, h_start_ft=35_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-        )
-        heavy = descend_segment(
-            W_start_lb=350_000, h_start_ft=35_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-        )
-        assert heavy["fuel_burned_lb"] > light["fuel_burned_lb"]
-
-    def test_descent_fuel_reasonable_magnitude(self):
+    @pytest.mark.parametrize("smaller, larger, key", [
+        pytest.param("drop_20k", "drop_35k", "fuel_burned_lb",
+                     id="larger_drop_more_fuel"),
+        pytest.param("drop_20k", "drop_35k", "distance_nm",
+                     id="larger_drop_more_distance"),
+        pytest.param("light_150k", "heavy_350k", "fuel_burned_lb",
+                     id="heavier_more_fuel"),
+    ])
+    def test_descent_ordering(self, descend_matrix, smaller, larger, key):
+        """Longer descents cover more ground and burn more fuel; heavier
+        aircraft (higher drag) burn more fuel descending."""
+        assert descend_matrix[larger][key] > descend_matrix[smaller][key]
+
+    def test_descent_fuel_reasonable_magnitude(self, baseline_descend):
         """Descent from 35,000 to 5,000 ft should burn a few hundred to
         a few thousand pounds at idle for a 767-class aircraft."""
-        result = descend_segment(
-            W_start_lb=250_000, h_start_ft=35_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-        )
         # At 10% idle fraction, expect roughly 200-1,500 lb
-        assert 50 < result["fuel_burned_lb"] < 3_000
+        assert 50 < baseline_descend["fuel_burned_lb"] < 3_000
 
-    def test_descent_distance_reasonable(self):
+    def test_descent_distance_reasonable(self, baseline_descend):
         """Descent from 35,000 to 5,000 ft at 2,000 ft/min at M0.72
         should cover roughly 100-200 nm."""
-        result = descend_segment(
-            W_start_lb=250_000, h_start_ft=35_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-        )
         # 30,000 ft / 2,000 fpm = 15 min = 0.25 hr
         # At ~420 ktas, distance ~ 105 nm
-        assert 50 < result["distance_nm"] < 250
+        assert 50 < baseline_descend["distance_nm"] < 250
 
-    def test_descent_time_correct(self):
+    def test_descent_time_correct(self, baseline_descend):
         """Descent time should equal altitude change / descent rate."""
-        result = descend_segment(
-            W_start_lb=250_000, h_start_ft=35_000, h_target_ft=5_000,
-            mach_descent=SYNTH_MACH_DESCENT, wing_area_ft2=SYNTH_WING_AREA,
-            CD0=SYNTH_CD0, AR=SYNTH_AR, e=SYNTH_E,
-            tsfc_ref=SYNTH_TSFC_REF, k_adj=SYNTH_K_ADJ,
-            descent_rate_fpm=2000.0,
-        )
         expected_time_hr = (35_000 - 5_000) / 2000.0 / 60.0  # 0.25 hr
-        assert result["time_hr"] == pytest.approx(expected_time_hr, rel=1e-10)
+        assert math.isclose(baseline_descend["time_hr"], expected_time_hr,
+                            rel_tol=1e-10, abs_tol=0.0)
+
+
+class TestDescendSegmentBatch:
+    """Tests for descend_segment_batch()."""
+
+    def test_matches_descend_segment(self):
+        """Each batch element should reproduce the scalar descend_segment(),
+        including a zero result when there is nothing to descend."""
+        W = np.array([250_000.0, 350_000.0, 250_000.0])
+        h_start = np.array([35_000.0, 40_000.0, 3_000.0])
+        rate = np.array([2000.0, 1500.0, 2000.0])
+        batch = _descend_batch(W_start_lb=W, h_start_ft=h_start,
+                               h_target_ft=5_000, descent_rate_fpm=rate)
+        for i in range(W.size):
+            single = _descend(W_start_lb=W[i], h_start_ft=h_start[i],
+                              h_target_ft=5_000, descent_rate_fpm=rate[i])
+            for key in ("fuel_burned_lb", "distance_nm", "time_hr"):
+                assert batch[key][i] == pytest.approx(single[key], rel=1e-12)
 
 
 # --- Synthetic aircraft dict and calibration for Mission 2 testing ---
 # This mimics the structure produced by loader.py + calibrate_aircraft()
 
-def _make_synth_aircraft(designation="SYNTH-767", oew=180_000, mtow=395_000,
-                          max_fuel=160_000, max_payload=80_000,
-                          n_engines=2, cruise_mach=0.80):
-    """Create a synthetic aircraft dict for testing."""
-    return {
-        "designation": designation,
-        "name": f"Synthetic {designation}",
-        "OEW": oew,
-        "MTOW": mtow,
-        "MZFW": oew + max_payload,
-        "max_payload": max_payload,
-        "max_fuel": max_fuel,
-        "wing_area_ft2": SYNTH_WING_AREA,
-        "wingspan_ft": 156.0,
-        "aspect_ratio": SYNTH_AR,
-        "n_engines": n_engines,
-        "cruise_mach": cruise_mach,
-        "tsfc_cruise_ref": SYNTH_TSFC_REF,
-        "thrust_per_engine_slst_lbf": SYNTH_THRUST_SLST,
-        "service_ceiling_ft": 43_000,
-    }
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SynthAC:
+    """Synthetic aircraft inputs that tests may override."""
+    designation: str = "SYNTH-767"
+    oew: float = 180_000
+    mtow: float = 395_000
+    max_fuel: float = 160_000
+    max_payload: float = 80_000
+    n_engines: int = 2
+    cruise_mach: float = 0.80
+    service_ceiling_ft: float = 43_000
+
+    def to_dict(self):
+        """Aircraft dict in the loader.py layout."""
+        return {
+            "designation": self.designation,
+            "name": f"Synthetic {self.designation}",
+            "OEW": self.oew,
+            "MTOW": self.mtow,
+            "MZFW": self.oew + self.max_payload,
+            "max_payload": self.max_payload,
+            "max_fuel": self.max_fuel,
+            "wing_area_ft2": SYNTH.wing_area_ft2,
+            "wingspan_ft": 156.0,
+            "aspect_ratio": SYNTH.AR,
+            "n_engines": self.n_engines,
+            "cruise_mach": self.cruise_mach,
+            "tsfc_cruise_ref": SYNTH.tsfc_ref,
+            "thrust_per_engine_slst_lbf": SYNTH.thrust_slst_lbf,
+            "service_ceiling_ft": self.service_ceiling_ft,
+        }
+
+
+def _make_synth_aircraft(**overrides):
+    """Create a synthetic aircraft dict, overriding SynthAC fields by name."""
+    return SynthAC(**overrides).to_dict()
 
 
 def _make_synth_calibration():
     """Create a synthetic calibration result dict for testing."""
     return {
-        "CD0": SYNTH_CD0,
-        "e": SYNTH_E,
-        "k_adj": SYNTH_K_ADJ,
+        "CD0": SYNTH.CD0,
+        "e": SYNTH.e,
+        "k_adj": SYNTH.k_adj,
         "f_oh": 0.05,
     }
 
 
+# Read-only default instances. Tests that change an aircraft field build a
+# new one with _make_synth_aircraft(**overrides); tests that change a
+# calibration field layer an override dict over DEFAULT_SYNTH_CAL with
+# ChainMap
+DEFAULT_SYNTH_AC = MappingProxyType(SynthAC().to_dict())
+DEFAULT_SYNTH_CAL = MappingProxyType(_make_synth_calibration())
+
+
+@pytest.fixture(scope="session")
+def mission2_default():
+    """Mission 2 for the synthetic aircraft at the default 52,000 lb
+    payload over 4,200 nm, shared by the tests that only read it."""
+    return simulate_mission2_sampling(DEFAULT_SYNTH_AC, DEFAULT_SYNTH_CAL,
+                                      payload_lb=52_000, distance_nm=4_200)
+
+
+@pytest.fixture(scope="session")
+def mission2_small_fleet():
+    """Mission 2 for an aircraft whose 10,000 lb max payload forces a fleet."""
+    ac = _make_synth_aircraft(designation="SMALL", max_payload=10_000)
+    return simulate_mission2_sampling(ac, DEFAULT_SYNTH_CAL, payload_lb=52_000)
+
+
 class TestMission2Sampling:
     """Tests for simulate_mission2_sampling()."""
 
-    def test_basic_feasibility(self):
+    def test_basic_feasibility(self, mission2_default):
         """A well-configured aircraft should complete the mission."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
-                                             distance_nm=4_200)
+        result = mission2_default
         # With 163,000 lb fuel (395k - 180k - 52k), mission should be feasible
         assert result["feasible"] is True
         pa = result["per_aircraft"]
         assert pa["distance_covered_nm"] >= 4_200
         assert pa["n_cycles"] >= 1
 
-    def test_returns_expected_keys(self):
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal)
-        assert "feasible" in result
-        assert "per_aircraft" in result
-        assert "designation" in result
-        assert "n_aircraft" in result
+    def test_returns_expected_keys(self, mission2_default):
+        result = mission2_default
+        assert {"feasible", "per_aircraft", "designation",
+                "n_aircraft"} <= result.keys()
         pa = result["per_aircraft"]
-        assert "cycles" in pa
-        assert "profile_points" in pa
-        assert "peak_ceiling_ft" in pa
-        assert "fuel_cost_usd" in pa
+        assert {"cycles", "profile_points", "peak_ceiling_ft",
+                "fuel_cost_usd"} <= pa.keys()
 
-    def test_ceiling_increases_with_cycles(self):
+    def test_ceiling_increases_with_cycles(self, mission2_default):
         """As fuel burns off, ceiling should increase (progressive ceiling).
 
         With the two-regime thrust model, heavy aircraft are thrust-limited
         below the published ceiling. As fuel burns, they get lighter and
         can reach higher. This is the core scientific output of Mission 2.
         """
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
-                                             distance_nm=4_200)
+        result = mission2_default
         pa = result["per_aircraft"]
         cycles = pa["cycles"]
         if len(cycles) >= 3:
             # Compare first and last full cycle ceilings — should show increase
-            full_cycles = [c for c in cycles if not c.get("partial", False)]
-            if len(full_cycles) >= 2:
-                assert full_cycles[-1]["ceiling_ft"] >= full_cycles[0]["ceiling_ft"]
-
-    def test_fleet_sizing_small_aircraft(self):
+            first = next((c for c in cycles if not c.get("partial", False)),
+                         None)
+            last = next((c for c in reversed(cycles)
+                         if not c.get("partial", False)), None)
+            if first is not last:
+                assert last["ceiling_ft"] >= first["ceiling_ft"]
+
+    def test_fleet_sizing_small_aircraft(self, mission2_small_fleet):
         """Aircraft with small max_payload should trigger fleet sizing."""
-        ac = _make_synth_aircraft(designation="SMALL", max_payload=10_000)
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000)
-        assert result["n_aircraft"] == math.ceil(52_000 / 10_000)
+        result = mission2_small_fleet
+        assert result["n_aircraft"] == -(-52_000 // 10_000)
         assert result["payload_actual_lb"] < 52_000
 
-    def test_fleet_aggregate_computed(self):
+    def test_fleet_aggregate_computed(self, mission2_small_fleet):
         """Multi-aircraft fleet should have aggregate cost data."""
-        ac = _make_synth_aircraft(designation="SMALL", max_payload=10_000)
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000)
+        result = mission2_small_fleet
         if result["feasible"] or result["per_aircraft"] is not None:
             assert result["aggregate"] is not None
             assert result["aggregate"]["n_aircraft"] > 1
@@ -395,76 +491,79 @@ class TestMission2Sampling:
         """An aircraft that can't carry payload within MTOW should be infeasible."""
         # OEW + payload > MTOW, no room for fuel
         ac = _make_synth_aircraft(oew=350_000, mtow=395_000, max_payload=80_000)
-        cal = _make_synth_calibration()
+        cal = DEFAULT_SYNTH_CAL
         result = simulate_mission2_sampling(ac, cal, payload_lb=52_000)
         # fuel_available = min(395k - 350k - 52k, max_fuel) = min(-7k, ...) < 0
         assert result["feasible"] is False
 
-    def test_weight_decreases_across_cycles(self):
+    def test_fuel_budget_matches_simulation(self, mission2_default):
+        """The pre-simulation budget should agree with the full run, and
+        flag an over-MTOW payload without simulating."""
+        budget = _mission2_fuel_budget(DEFAULT_SYNTH_AC, DEFAULT_SYNTH_CAL,
+                                       payload_lb=52_000)
+        pa = mission2_default["per_aircraft"]
+        assert budget["infeasible_reason"] is None
+        assert budget["mission_fuel_lb"] == pa["mission_fuel_lb"]
+        assert budget["reserve_fuel_lb"] == pa["reserve_fuel_lb"]
+
+        ac = _make_synth_aircraft(oew=350_000, mtow=395_000, max_payload=80_000)
+        budget = _mission2_fuel_budget(ac, DEFAULT_SYNTH_CAL, payload_lb=52_000)
+        assert budget["infeasible_reason"] == "Cannot carry payload within MTOW"
+        assert budget["mission_fuel_lb"] is None
+
+    def test_weight_decreases_across_cycles(self, mission2_default):
         """Aircraft weight should decrease as fuel is burned."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
-                                             distance_nm=4_200)
+        result = mission2_default
         pa = result["per_aircraft"]
         cycles = pa["cycles"]
         if len(cycles) >= 2:
             assert cycles[-1]["weight_end_lb"] < cycles[0]["weight_start_lb"]
 
-    def test_profile_points_monotonic_distance(self):
+    def test_profile_points_monotonic_distance(self, mission2_default):
         """Profile distance coordinates should be monotonically increasing."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
-                                             distance_nm=4_200)
+        result = mission2_default
         pa = result["per_aircraft"]
         points = pa["profile_points"]
         if len(points) >= 2:
-            distances = [p[0] for p in points]
-            for i in range(1, len(distances)):
-                assert distances[i] >= distances[i - 1]
-
-    def test_profile_shows_sawtooth(self):
-        """Profile altitude should oscillate between h_low and ceiling."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
-                                             distance_nm=4_200, h_low_ft=5_000)
-        pa = result["per_aircraft"]
+            distances = np.fromiter((p[0] for p in points), dtype=np.float64,
+                                    count=len(points))
+            assert np.all(np.diff(distances) >= 0)
+
+    def test_profile_shows_sawtooth(self, mission2_default):
+        """Profile altitude should oscillate between h_low (5,000 ft by
+        default) and ceiling."""
+        pa = mission2_default["per_aircraft"]
         points = pa["profile_points"]
         if len(points) >= 3:
-            altitudes = [p[1] for p in points]
+            altitudes = np.fromiter((p[1] for p in points), dtype=np.float64,
+                                    count=len(points))
             # Should have both low (5,000 ft) and high (>20,000 ft) altitudes
-            assert min(altitudes) == 5_000
-            assert max(altitudes) > 20_000
+            assert altitudes.min() == 5_000
+            assert altitudes.max() > 20_000
 
-    def test_fuel_accounting_consistent(self):
+    def test_fuel_accounting_consistent(self, mission2_default):
         """Total fuel burned + remaining should equal mission fuel budget."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
-                                             distance_nm=4_200)
+        result = mission2_default
         pa = result["per_aircraft"]
         # fuel_burned + fuel_remaining should equal mission_fuel
         total = pa["fuel_burned_lb"] + pa["fuel_remaining_lb"]
-        assert total == pytest.approx(pa["mission_fuel_lb"], rel=0.01)
+        assert math.isclose(total, pa["mission_fuel_lb"], rel_tol=0.01)
 
-    def test_short_distance_fewer_cycles(self):
+    def test_short_distance_fewer_cycles(self, mission2_default):
         """A shorter mission should require fewer cycles."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
+        ac = DEFAULT_SYNTH_AC
+        cal = DEFAULT_SYNTH_CAL
         short = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
                                             distance_nm=1_000)
-        long = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
-                                           distance_nm=4_200)
+        long = mission2_default
         assert short["per_aircraft"]["n_cycles"] <= long["per_aircraft"]["n_cycles"]
 
     def test_no_foh_used(self):
         """Mission 2 should not use f_oh — fuel budget is explicit reserves only."""
-        ac = _make_synth_aircraft()
+        ac = DEFAULT_SYNTH_AC
         # Use a large f_oh to verify it's NOT being used
-        cal = _make_synth_calibration()
-        cal["f_oh"] = 0.30  # would remove 30% of MTOW as overhead if used
+        # f_oh = 0.30 would remove 30% of MTOW as overhead if used
+        cal = ChainMap({"f_oh": 0.30}, DEFAULT_SYNTH_CAL)
         result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
                                              distance_nm=4_200)
         pa = result["per_aircraft"]
@@ -477,26 +576,28 @@ class TestMission2Sampling:
         even when the aircraft is light enough to climb higher."""
         # Use a light aircraft with modest ceiling — should be capped
         ac = _make_synth_aircraft(oew=150_000, mtow=395_000,
-                                   max_payload=80_000, max_fuel=160_000)
-        ac["service_ceiling_ft"] = 40_000  # low ceiling for easy testing
-        cal = _make_synth_calibration()
+                                   max_payload=80_000, max_fuel=160_000,
+                                   service_ceiling_ft=40_000)  # low ceiling
+        cal = DEFAULT_SYNTH_CAL
         result = simulate_mission2_sampling(ac, cal, payload_lb=30_000,
                                              distance_nm=2_000)
         pa = result["per_aircraft"]
-        for c in pa["cycles"]:
-            assert c["ceiling_ft"] <= 40_000, (
-                f"Cycle {c['cycle']} ceiling {c['ceiling_ft']} exceeds "
-                f"service ceiling 40,000 ft"
-            )
+        assert pa["cycles"], "Mission 2 flew no sawtooth cycles"
+        c = max(pa["cycles"], key=lambda c: c["ceiling_ft"])
+        assert c["ceiling_ft"] <= 40_000, (
+            f"Cycle {c['cycle']} ceiling {c['ceiling_ft']} exceeds "
+            f"service ceiling 40,000 ft"
+        )
 
     def test_progressive_ceiling_strict(self):
         """With heavy payload and enough fuel, early cycles should have lower
         ceilings than later cycles when the aircraft is thrust-limited."""
         # Use a heavy configuration so the aircraft starts thrust-limited
+        # High service ceiling cap so thrust limits first
         ac = _make_synth_aircraft(oew=180_000, mtow=395_000,
-                                   max_payload=80_000, max_fuel=160_000)
-        ac["service_ceiling_ft"] = 50_000  # high cap so thrust limits first
-        cal = _make_synth_calibration()
+                                   max_payload=80_000, max_fuel=160_000,
+                                   service_ceiling_ft=50_000)
+        cal = DEFAULT_SYNTH_CAL
         result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
                                              distance_nm=4_200)
         pa = result["per_aircraft"]
@@ -512,9 +613,8 @@ class TestMission2Sampling:
     def test_zero_progress_breaks_loop(self):
         """Aircraft that can't climb above h_low should not loop forever."""
         # Use extremely high CD0 so drag exceeds thrust at all altitudes
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        cal["CD0"] = 0.20  # absurdly high — no climb possible
+        ac = DEFAULT_SYNTH_AC
+        cal = ChainMap({"CD0": 0.20}, DEFAULT_SYNTH_CAL)
         result = simulate_mission2_sampling(ac, cal, payload_lb=52_000,
                                              distance_nm=4_200)
         assert result["feasible"] is False
@@ -523,27 +623,30 @@ class TestMission2Sampling:
         assert pa["n_cycles"] == 0
 
 
+@pytest.fixture(scope="session")
+def mission3_default():
+    """Mission 3 for the synthetic aircraft at the defaults: 30,000 lb
+    payload for 8 hours at 1,500 ft."""
+    return simulate_mission3_low_altitude(DEFAULT_SYNTH_AC, DEFAULT_SYNTH_CAL,
+                                          payload_lb=30_000, duration_hr=8.0,
+                                          h_mission_ft=1_500)
+
+
 class TestMission3LowAltitude:
     """Tests for simulate_mission3_low_altitude()."""
 
-    def test_basic_feasibility(self):
+    def test_basic_feasibility(self, mission3_default):
         """A well-configured aircraft should complete 8 hours at low altitude."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission3_low_altitude(ac, cal, payload_lb=30_000,
-                                                 duration_hr=8.0)
+        result = mission3_default
         assert result["feasible"] is True
         pa = result["per_aircraft"]
         assert pa["endurance_hr"] >= 8.0 - 0.01
         assert pa["distance_covered_nm"] > 0
         assert pa["fuel_burned_lb"] > 0
 
-    def test_returns_expected_keys(self):
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission3_low_altitude(ac, cal)
-        assert "feasible" in result
-        assert "per_aircraft" in result
+    def test_returns_expected_keys(self, mission3_default):
+        result = mission3_default
+        assert {"feasible", "per_aircraft"} <= result.keys()
         pa = result["per_aircraft"]
         expected_keys = [
             "takeoff_weight_lb", "oew_lb", "payload_lb",
@@ -554,42 +657,39 @@ class TestMission3LowAltitude:
             "avg_fuel_flow_lbhr", "steps",
             "fuel_cost_usd", "fuel_cost_per_1000lb_nm",
         ]
-        for key in expected_keys:
-            assert key in pa, f"Missing key: {key}"
+        missing = set(expected_keys) - pa.keys()
+        assert not missing, f"Missing keys: {sorted(missing)}"
 
     def test_fleet_sizing_for_small_aircraft(self):
         """Aircraft with max payload < 30,000 lb need a fleet."""
         ac = _make_synth_aircraft(max_payload=10_000)
-        cal = _make_synth_calibration()
+        cal = DEFAULT_SYNTH_CAL
         result = simulate_mission3_low_altitude(ac, cal, payload_lb=30_000)
         assert result["n_aircraft"] == 3
-        assert result["payload_actual_lb"] == pytest.approx(10_000, abs=1)
+        assert math.isclose(result["payload_actual_lb"], 10_000,
+                            rel_tol=0.0, abs_tol=1)
         assert result["aggregate"] is not None
         assert result["aggregate"]["n_aircraft"] == 3
 
-    def test_fuel_increases_with_duration(self):
+    def test_fuel_increases_with_duration(self, mission3_default):
         """Longer endurance requires more fuel."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        r4 = simulate_mission3_low_altitude(ac, cal, duration_hr=4.0)
-        r8 = simulate_mission3_low_altitude(ac, cal, duration_hr=8.0)
+        r4 = simulate_mission3_low_altitude(DEFAULT_SYNTH_AC, DEFAULT_SYNTH_CAL,
+                                            duration_hr=4.0)
+        r8 = mission3_default
         assert (r8["per_aircraft"]["fuel_burned_lb"]
                 > r4["per_aircraft"]["fuel_burned_lb"])
 
-    def test_distance_positive_and_reasonable(self):
+    def test_distance_positive_and_reasonable(self, mission3_default):
         """Should cover significant distance in 8 hours at 250 KTAS."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission3_low_altitude(ac, cal, duration_hr=8.0)
-        pa = result["per_aircraft"]
+        pa = mission3_default["per_aircraft"]
         # At 250 KTAS for 8 hours, distance should be ~2,000 nm
         assert pa["distance_covered_nm"] > 1_500
         assert pa["distance_covered_nm"] < 2_500
 
     def test_endurance_decreases_with_payload(self):
         """Heavier payload means less fuel, shorter endurance (or more burned)."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
+        ac = DEFAULT_SYNTH_AC
+        cal = DEFAULT_SYNTH_CAL
         # Very light payload — lots of fuel
         r_light = simulate_mission3_low_altitude(ac, cal, payload_lb=10_000,
                                                    duration_hr=8.0)
@@ -600,19 +700,15 @@ class TestMission3LowAltitude:
         assert (r_light["per_aircraft"]["avg_fuel_flow_lbhr"]
                 < r_heavy["per_aircraft"]["avg_fuel_flow_lbhr"])
 
-    def test_altitude_is_mission_altitude(self):
-        """All steps should be at the mission altitude."""
-        ac = _make_synth_aircraft()
-        cal = _make_synth_calibration()
-        result = simulate_mission3_low_altitude(ac, cal, h_mission_ft=1_500)
-        pa = result["per_aircraft"]
-        for step in pa["steps"]:
-            assert step["altitude_ft"] == 1_500
+    def test_altitude_is_mission_altitude(self, mission3_default):
+        """All steps should be at the mission altitude (1,500 ft)."""
+        pa = mission3_default["per_aircraft"]
+        assert all(step["altitude_ft"] == 1_500 for step in pa["steps"])
 
     def test_infeasible_when_fuel_limited(self):
         """Aircraft with very little fuel should not endure 8 hours."""
         ac = _make_synth_aircraft(max_fuel=5_000)
-        cal = _make_synth_calibration()
+        cal = DEFAULT_SYNTH_CAL
         result = simulate_mission3_low_altitude(ac, cal, payload_lb=30_000,
                                                  duration_hr=8.0)
         assert result["feasible"] is False
@@ -621,7 +717,7 @@ class TestMission3LowAltitude:
         if pa is not None:
             assert pa["endurance_hr"] < 8.0
 
-    def test_fuel_loading_is_mission_sized(self):
+    def test_fuel_loading_is_mission_sized(self, mission3_default):
         """Fuel loaded should be much less than max fuel for endurance missions.
 
         The iterative fuel sizing should load only enough fuel for 8 hours
@@ -629,11 +725,7 @@ class TestMission3LowAltitude:
         aircraft with 160,000 lb max fuel, the 8-hour endurance burn should
         be well under 100,000 lb.
         """
-        ac = _make_synth_aircraft()  # max_fuel=160,000
-        cal = _make_synth_calibration()
-        result = simulate_mission3_low_altitude(ac, cal, payload_lb=30_000,
-                                                 duration_hr=8.0)
-        pa = result["per_aircraft"]
+        pa = mission3_default["per_aircraft"]  # max_fuel=160,000
         assert pa["total_fuel_lb"] < pa["max_fuel_available_lb"], (
             f"Fuel loaded ({pa['total_fuel_lb']:,.0f}) should be less than "
             f"max fuel ({pa['max_fuel_available_lb']:,.0f}) for endurance mission"
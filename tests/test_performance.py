@@ -2,13 +2,23 @@
 
 Tests aerodynamics, propulsion, and performance computation.
 """
-import sys
-sys.path.insert(0, '.')
+import hashlib
+import inspect
+import json
+import math
+from pathlib import Path
 
+import numpy as np
 import pytest
-import math
 from src.models import atmosphere, aerodynamics, propulsion, performance
-from src.models.calibration import compute_calibration_range
+from src.models.calibration import (
+    compute_calibration_range, compute_calibration_range_batch,
+)
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# pytest cache entry holding the session calibrations
+CALIBRATION_CACHE_KEY = "dc8_study/calibrations"
 
 
 class TestAerodynamics:
@@ -21,7 +31,7 @@ class TestAerodynamics:
     def test_lift_coefficient_scales_with_weight(self):
         CL1 = aerodynamics.lift_coefficient(100000, 250.0, 2000.0)
         CL2 = aerodynamics.lift_coefficient(200000, 250.0, 2000.0)
-        assert CL2 == pytest.approx(2 * CL1, rel=1e-10)
+        assert math.isclose(CL2, 2 * CL1, rel_tol=1e-10)
 
     def test_drag_coefficient_positive(self):
         CD = aerodynamics.drag_coefficient(0.5, 0.025, 8.0, 0.80)
@@ -35,34 +45,43 @@ class TestAerodynamics:
         CL = 0.5
         expected = CD0 + K * CL**2
         actual = aerodynamics.drag_coefficient(CL, CD0, AR, e)
-        assert actual == pytest.approx(expected, rel=1e-10)
-
-    def test_max_ld_physical_range(self):
+        assert math.isclose(actual, expected, rel_tol=1e-10)
+
+    def test_drag_polar_accepts_arrays(self):
+        """The polar should evaluate elementwise, with or without numba."""
+        CL = aerodynamics.lift_coefficient(
+            np.array([100000.0, 200000.0]), 250.0, 2000.0)
+        CD = aerodynamics.drag_coefficient(CL, 0.025, 8.0, 0.80)
+        assert CD == pytest.approx(
+            [aerodynamics.drag_coefficient(c, 0.025, 8.0, 0.80) for c in CL])
+
+    @pytest.mark.parametrize("CD0, AR, e", [
+        (0.020, 8.0, 0.80), (0.030, 9.5, 0.85), (0.025, 7.5, 0.75),
+    ])
+    def test_max_ld_physical_range(self, CD0, AR, e):
         """Max L/D should be 10-22 for transport aircraft parameters."""
-        for CD0, AR, e in [(0.020, 8.0, 0.80), (0.030, 9.5, 0.85),
-                           (0.025, 7.5, 0.75)]:
-            LD_max, CL_star = aerodynamics.max_lift_to_drag(CD0, AR, e)
-            assert 10 < LD_max < 22, f"L/D_max={LD_max} for CD0={CD0}, AR={AR}, e={e}"
-            assert CL_star > 0
+        LD_max, CL_star = aerodynamics.max_lift_to_drag(CD0, AR, e)
+        assert 10 < LD_max < 22, f"L/D_max={LD_max} for CD0={CD0}, AR={AR}, e={e}"
+        assert CL_star > 0
 
-    def test_max_ld_occurs_at_correct_cl(self):
+    @pytest.mark.parametrize("delta", [-0.1, -0.01, 0.01, 0.1])
+    def test_max_ld_occurs_at_correct_cl(self, delta):
         CD0 = 0.025
         AR = 8.0
         e = 0.80
         LD_max, CL_star = aerodynamics.max_lift_to_drag(CD0, AR, e)
         # Check that this is actually the maximum
-        for delta in [-0.1, -0.01, 0.01, 0.1]:
-            CL_test = CL_star + delta
-            if CL_test > 0:
-                LD_test = aerodynamics.lift_to_drag_ratio(CL_test, CD0, AR, e)
-                assert LD_test <= LD_max + 1e-10
+        CL_test = CL_star + delta
+        if CL_test > 0:
+            LD_test = aerodynamics.lift_to_drag_ratio(CL_test, CD0, AR, e)
+            assert LD_test <= LD_max + 1e-10
 
     def test_engine_out_drag_factor(self):
         factor = aerodynamics.engine_out_drag_factor(2, 10.0)
-        assert factor == pytest.approx(1.10, rel=1e-10)
+        assert math.isclose(factor, 1.10, rel_tol=1e-10)
 
         factor4 = aerodynamics.engine_out_drag_factor(4, 10.0)
-        assert factor4 == pytest.approx(1.10, rel=1e-10)
+        assert math.isclose(factor4, 1.10, rel_tol=1e-10)
 
 
 class TestPropulsion:
@@ -76,11 +95,11 @@ class TestPropulsion:
 
     def test_altitude_factor_unity_at_reference(self):
         f = propulsion.altitude_factor(35000, 35000)
-        assert f == pytest.approx(1.0, rel=1e-10)
+        assert math.isclose(f, 1.0, rel_tol=1e-10)
 
     def test_mach_factor_unity_at_reference(self):
         f = propulsion.mach_factor(0.80, 0.80)
-        assert f == pytest.approx(1.0, rel=1e-10)
+        assert math.isclose(f, 1.0, rel_tol=1e-10)
 
     def test_mach_factor_increases_with_mach(self):
         f_low = propulsion.mach_factor(0.75, 0.80)
@@ -130,7 +149,7 @@ class TestPropulsion:
             sigma = atmosphere.density_ratio(h)
             expected = 60000 * (sigma ** 0.75) * 2
             actual = propulsion.thrust_available_cruise(60000, h, 2)
-            assert actual == pytest.approx(expected, rel=1e-10), (
+            assert math.isclose(actual, expected, rel_tol=1e-10), (
                 f"Thrust at {h} ft should match original model"
             )
 
@@ -191,9 +210,9 @@ class TestPerformance:
             W_initial_lb=300000, mach=0.80, wing_area_ft2=2800,
             CD0=0.025, AR=8.0, e=0.80, tsfc_ref=0.65, n_steps=20,
         )
-        r1 = performance.step_cruise_range(fuel_available_lb=50000, **kwargs)
-        r2 = performance.step_cruise_range(fuel_available_lb=100000, **kwargs)
-        assert r2["range_nm"] > r1["range_nm"]
+        rs = performance.step_cruise_range_batch(
+            fuel_available_lb=np.array([50000.0, 100000.0]), **kwargs)
+        assert rs["range_nm"][1] > rs["range_nm"][0]
 
     def test_step_cruise_lighter_aircraft_more_efficient(self):
         """Same fuel, lighter aircraft should go further."""
@@ -201,55 +220,136 @@ class TestPerformance:
             fuel_available_lb=80000, mach=0.80, wing_area_ft2=2800,
             CD0=0.025, AR=8.0, e=0.80, tsfc_ref=0.65, n_steps=20,
         )
-        r_heavy = performance.step_cruise_range(W_initial_lb=300000, **kwargs)
-        r_light = performance.step_cruise_range(W_initial_lb=250000, **kwargs)
-        assert r_light["range_nm"] > r_heavy["range_nm"]
+        rs = performance.step_cruise_range_batch(
+            W_initial_lb=np.array([300000.0, 250000.0]), **kwargs)
+        assert rs["range_nm"][1] > rs["range_nm"][0]
+
+    @pytest.mark.parametrize("extra", [
+        pytest.param({}, id="optimal_altitude"),
+        pytest.param(dict(thrust_slst_lbf=40000, n_engines=2,
+                          ceiling_ft=41000, drag_multiplier=1.10),
+                     id="thrust_limited_engine_out"),
+        pytest.param(dict(fixed_altitude_ft=31000), id="fixed_altitude"),
+    ])
+    def test_step_cruise_batch_matches_scalar(self, extra):
+        """Each batch element should reproduce step_cruise_range()."""
+        kwargs = dict(
+            mach=0.80, wing_area_ft2=2800, CD0=0.025, AR=8.0, e=0.80,
+            tsfc_ref=0.65, n_steps=20, **extra,
+        )
+        W = np.array([300000.0, 250000.0, 350000.0])
+        fuel = np.array([100000.0, 60000.0, 120000.0])
+        rs = performance.step_cruise_range_batch(
+            W_initial_lb=W, fuel_available_lb=fuel, **kwargs)
+        for i in range(W.size):
+            r = performance.step_cruise_range(
+                W_initial_lb=W[i], fuel_available_lb=fuel[i], **kwargs)
+            assert rs["range_nm"][i] == pytest.approx(r["range_nm"], rel=1e-12)
+            assert rs["fuel_burned_lb"][i] == pytest.approx(
+                r["fuel_burned_lb"], rel=1e-12)
+
+
+@pytest.fixture(scope="module")
+def dc8(all_aircraft):
+    """DC-8 aircraft data from the session-wide aircraft set."""
+    return all_aircraft["DC-8"]
 
 
 class TestCalibrationRange:
     """Tests for the calibration range computation."""
 
-    def test_positive_range(self):
-        from src.aircraft_data.loader import load_aircraft
-        dc8 = load_aircraft("DC-8")
+    def test_positive_range(self, dc8):
         r = compute_calibration_range(dc8, 52000, 116000, 0.025, 0.80, 1.0, 0.12)
         assert r > 0
 
-    def test_more_fuel_more_range(self):
-        from src.aircraft_data.loader import load_aircraft
-        dc8 = load_aircraft("DC-8")
-        r1 = compute_calibration_range(dc8, 20000, 80000, 0.025, 0.80, 1.0, 0.12)
-        r2 = compute_calibration_range(dc8, 20000, 120000, 0.025, 0.80, 1.0, 0.12)
-        assert r2 > r1
-
-    def test_overhead_reduces_range(self):
-        from src.aircraft_data.loader import load_aircraft
-        dc8 = load_aircraft("DC-8")
-        r_low = compute_calibration_range(dc8, 20000, 100000, 0.025, 0.80, 1.0, 0.05)
-        r_high = compute_calibration_range(dc8, 20000, 100000, 0.025, 0.80, 1.0, 0.20)
-        assert r_low > r_high
-
-    def test_zero_range_if_overhead_exceeds_fuel(self):
-        from src.aircraft_data.loader import load_aircraft
-        dc8 = load_aircraft("DC-8")
+    def test_more_fuel_more_range(self, dc8):
+        r = compute_calibration_range_batch(
+            dc8, 20000, np.array([80000, 120000]), 0.025, 0.80, 1.0, 0.12)
+        assert r[1] > r[0]
+
+    def test_overhead_reduces_range(self, dc8):
+        r = compute_calibration_range_batch(
+            dc8, 20000, 100000, 0.025, 0.80, 1.0, np.array([0.05, 0.20]))
+        assert r[0] > r[1]
+
+    def test_zero_range_if_overhead_exceeds_fuel(self, dc8):
         r = compute_calibration_range(dc8, 50000, 10000, 0.025, 0.80, 1.0, 0.50)
         assert r == 0  # overhead > fuel
 
-
+    def test_batch_matches_scalar(self, dc8):
+        """Each batch element should reproduce compute_calibration_range(),
+        including a zero range where overhead exceeds fuel."""
+        payload = np.array([52000, 20000, 20000, 50000])
+        fuel = np.array([116000, 80000, 120000, 10000])
+        f_oh = np.array([0.12, 0.05, 0.20, 0.50])
+        r = compute_calibration_range_batch(dc8, payload, fuel,
+                                            0.025, 0.80, 1.0, f_oh)
+        for i in range(payload.size):
+            expected = compute_calibration_range(
+                dc8, payload[i], fuel[i], 0.025, 0.80, 1.0, f_oh[i])
+            assert r[i] == pytest.approx(expected, rel=1e-12)
+
+
+def _calibration_cache_key(all_ac):
+    """Digest of the aircraft data and code behind a calibration.
+
+    Any change to the data, to the code under src/, or to
+    _run_calibrations() (which aircraft are calibrated and which fields
+    are kept) gives a new key, so a cached calibration is only reused for
+    an identical model.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(all_ac, sort_keys=True, default=repr).encode())
+    digest.update(inspect.getsource(_run_calibrations).encode())
+    for path in sorted(SRC_DIR.rglob("*.py")):
+        digest.update(path.relative_to(SRC_DIR).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _run_calibrations(all_ac):
+    """Calibrate every study aircraft, keeping the fields the tests check."""
+    from src.models.calibration import calibrate_aircraft, calibrate_p8_from_737
+    cals = {}
+    for des in ["DC-8", "GV", "737-900ER", "767-200ER", "A330-200", "777-200LR"]:
+        cals[des] = calibrate_aircraft(all_ac[des])
+    cals["P-8"] = calibrate_p8_from_737(cals["737-900ER"], all_ac["P-8"], all_ac["737-900ER"])
+    return {
+        des: {"rms_error": float(cal["rms_error"]),
+              "L_D_max": float(cal["L_D_max"])}
+        for des, cal in cals.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def calibrations(request, all_aircraft):
+    """Calibration results for all study aircraft.
+
+    The six optimizer runs take minutes, so results are kept in the pytest
+    cache (.pytest_cache) and reused while the aircraft data and src/ are
+    unchanged. A stale entry is cleared before recalibrating. Run with
+    --cache-clear to force a fresh calibration.
+    """
+    key = _calibration_cache_key(all_aircraft)
+
+    cache = getattr(request.config, "cache", None)  # absent with -p no:cacheprovider
+    if cache is not None:
+        cached = cache.get(CALIBRATION_CACHE_KEY, None)
+        if cached is not None:
+            if cached["key"] == key:
+                return cached["calibrations"]
+            cache.set(CALIBRATION_CACHE_KEY, None)
+
+    cals = _run_calibrations(all_aircraft)
+    if cache is not None:
+        cache.set(CALIBRATION_CACHE_KEY, {"key": key, "calibrations": cals})
+    return cals
+
+
+@pytest.mark.slow
 class TestCalibrationQuality:
     """Test that calibrated models match published data."""
 
-    @pytest.fixture(scope="class")
-    def calibrations(self):
-        from src.aircraft_data.loader import load_all_aircraft
-        from src.models.calibration import calibrate_aircraft, calibrate_p8_from_737
-        all_ac = load_all_aircraft()
-        cals = {}
-        for des in ["DC-8", "GV", "737-900ER", "767-200ER", "A330-200", "777-200LR"]:
-            cals[des] = calibrate_aircraft(all_ac[des])
-        cals["P-8"] = calibrate_p8_from_737(cals["737-900ER"], all_ac["P-8"], all_ac["737-900ER"])
-        return cals
-
     def test_dc8_rms_below_5pct(self, calibrations):
         assert calibrations["DC-8"]["rms_error"] < 0.05
 